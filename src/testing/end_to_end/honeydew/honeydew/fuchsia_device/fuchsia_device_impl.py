@@ -8,10 +8,10 @@ import ipaddress
 import json
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from datetime import datetime
 from functools import cached_property
-from typing import Any
+from typing import Any, TypeVar
 
 import fidl_fuchsia_buildinfo as f_buildinfo
 import fidl_fuchsia_developer_remotecontrol as fd_remotecontrol
@@ -126,6 +126,17 @@ _LOG_SEVERITIES: dict[custom_types.LEVEL, f_diagnostics.Severity] = {
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+async def _discard_result(coro: Coroutine[Any, Any, Any]) -> None:
+    """Awaits the coroutine for its errors only and drops its result.
+
+    Args:
+        coro: Coroutine of a FIDL call whose response is not needed.
+    """
+    await coro
+
 
 class FuchsiaDeviceImpl(
     fuchsia_device_interface.FuchsiaDevice,
@@ -199,6 +210,8 @@ class FuchsiaDeviceImpl(
         self._config: dict[str, Any] | None = config
         self._created_context = False
 
+        self._rcs_client: fd_remotecontrol.RemoteControlClient | None = None
+
         self.health_check()
 
         _LOGGER.debug("Initialized FuchsiaDevice")
@@ -658,9 +671,22 @@ class FuchsiaDeviceImpl(
     # List all the public methods
     def close(self) -> None:
         """Clean up method."""
-        for on_device_close_fns in self._on_device_close_fns:
-            _LOGGER.info("Calling %s", on_device_close_fns.__qualname__)
-            on_device_close_fns()
+        try:
+            for on_device_close_fns in self._on_device_close_fns:
+                _LOGGER.info("Calling %s", on_device_close_fns.__qualname__)
+                on_device_close_fns()
+        finally:
+            # The RemoteControl client, the event loop and the lock bound to it
+            # are only created on first use, and get created again if the device
+            # is used after close().
+            self._rcs_client = None
+            if "_loop" in self.__dict__:
+                loop: asyncio.AbstractEventLoop = self.__dict__.pop("_loop")
+                self.__dict__.pop("_rcs_lock", None)
+                try:
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                finally:
+                    loop.close()
 
     def health_check(self) -> None:
         """Ensure device is healthy.
@@ -803,6 +829,8 @@ class FuchsiaDeviceImpl(
 
         # Create a new Fuchsia controller context for new device connection.
         self.fuchsia_controller.create_context()
+        # RemoteControl client was bound to the old context.
+        self._rcs_client = None
 
         # Ensure device is healthy
         self.health_check()
@@ -1011,7 +1039,7 @@ class FuchsiaDeviceImpl(
                     _FC_PROXIES["BuildInfo"]
                 )
             )
-            build_info_resp = asyncio.run(
+            build_info_resp = self._sync(
                 buildinfo_provider_proxy.get_build_info()
             )
             return build_info_resp.build_info
@@ -1036,7 +1064,7 @@ class FuchsiaDeviceImpl(
                     _FC_PROXIES["DeviceInfo"]
                 )
             )
-            device_info_resp = asyncio.run(hwinfo_device_proxy.get_info())
+            device_info_resp = self._sync(hwinfo_device_proxy.get_info())
             return device_info_resp.info
         except fcp.ZxStatus as status:
             raise fc_errors.FuchsiaControllerError(
@@ -1059,7 +1087,7 @@ class FuchsiaDeviceImpl(
                     _FC_PROXIES["ProductInfo"]
                 )
             )
-            product_info_resp = asyncio.run(hwinfo_product_proxy.get_info())
+            product_info_resp = self._sync(hwinfo_product_proxy.get_info())
             return product_info_resp.info
         except fcp.ZxStatus as status:
             raise fc_errors.FuchsiaControllerError(
@@ -1083,14 +1111,46 @@ class FuchsiaDeviceImpl(
                     _FC_PROXIES["LastRebootInfo"]
                 )
             )
-            resp = asyncio.run(proxy.get())
+            resp = self._sync(proxy.get())
             return resp.last_reboot
         except fcp.ZxStatus as status:
             raise fc_errors.FuchsiaControllerError(
                 "_last_reboot_info() failed"
             ) from status
 
+    @cached_property
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the event loop used to drive FIDL calls on this device.
+
+        The loop is created once and reused, which avoids the event loop setup
+        and teardown that `asyncio.run()` performs on every call.
+
+        Returns:
+            Event loop object.
+        """
+        return asyncio.new_event_loop()
+
+    @cached_property
+    def _rcs_lock(self) -> asyncio.Lock:
+        """Returns the lock that serializes use of the RemoteControl client.
+
+        Returns:
+            asyncio.Lock object.
+        """
+        return asyncio.Lock()
+
     # List all private methods
+    def _sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Runs the coroutine to completion on this device's event loop.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Result of the coroutine.
+        """
+        return self._loop.run_until_complete(coro)
+
     def _send_log_command(
         self, tag: str, message: str, level: custom_types.LEVEL
     ) -> None:
@@ -1111,19 +1171,50 @@ class FuchsiaDeviceImpl(
             message,
             level,
         )
+        severity: f_diagnostics.Severity = _LOG_SEVERITIES[level]
         try:
-            rcs_proxy = fd_remotecontrol.RemoteControlClient(
-                self.fuchsia_controller.ctx.connect_remote_control_proxy()
+            self._sync(
+                self._log_message(tag=tag, message=message, severity=severity)
             )
-            asyncio.run(
-                rcs_proxy.log_message(
-                    tag=tag, message=message, severity=_LOG_SEVERITIES[level]
+        except fcp.ZxStatus:
+            # The cached RemoteControl connection may have gone stale. Drop it
+            # and retry once on a fresh connection.
+            self._rcs_client = None
+            try:
+                self._sync(
+                    self._log_message(
+                        tag=tag, message=message, severity=severity
+                    )
+                )
+            except fcp.ZxStatus as status:
+                raise fc_errors.FuchsiaControllerError(
+                    "Fuchsia Controller FIDL Error"
+                ) from status
+
+    async def _log_message(
+        self, tag: str, message: str, severity: f_diagnostics.Severity
+    ) -> None:
+        """Write a message to the syslog using the shared RemoteControl client.
+
+        The RemoteControl client is created on first use and reused by
+        subsequent calls. Concurrent callers are serialized on `_rcs_lock`.
+
+        Args:
+            tag: Tag to apply to the message in the syslog.
+            message: Message that need to logged.
+            severity: Log message severity.
+
+        Raises:
+            fcp.ZxStatus: On FIDL communication failure.
+        """
+        async with self._rcs_lock:
+            if self._rcs_client is None:
+                self._rcs_client = fd_remotecontrol.RemoteControlClient(
+                    self.fuchsia_controller.ctx.connect_remote_control_proxy()
                 )
+            await self._rcs_client.log_message(
+                tag=tag, message=message, severity=severity
             )
-        except fcp.ZxStatus as status:
-            raise fc_errors.FuchsiaControllerError(
-                "Fuchsia Controller FIDL Error"
-            ) from status
 
     def _send_reboot_command(self) -> None:
         """Send a device command to trigger a soft reboot.
@@ -1137,25 +1228,28 @@ class FuchsiaDeviceImpl(
                     _FC_PROXIES["PowerAdmin"]
                 )
             )
-            asyncio.run(
-                power_proxy.perform_reboot(
-                    options=fhp_statecontrol.RebootOptions(
-                        reasons=[
-                            fhp_statecontrol.RebootReason2.DEVELOPER_REQUEST
-                        ],
-                    ),
+            self._sync(
+                _discard_result(
+                    power_proxy.perform_reboot(
+                        options=fhp_statecontrol.RebootOptions(
+                            reasons=[
+                                fhp_statecontrol.RebootReason2.DEVELOPER_REQUEST
+                            ],
+                        ),
+                    )
                 )
             )
         except fcp.ZxStatus as status:
             # ZX_ERR_PEER_CLOSED is expected in this instance because the device
             # powered off.
-            zx_status: int | None = (
-                status.args[0] if len(status.args) > 0 else None
-            )
-            if zx_status != fcp.ZxStatus.ZX_ERR_PEER_CLOSED:
-                raise fc_errors.FuchsiaControllerError(
-                    "Fuchsia Controller FIDL Error"
-                ) from status
+            if (
+                status.args
+                and status.args[0] == fcp.ZxStatus.ZX_ERR_PEER_CLOSED
+            ):
+                return
+            raise fc_errors.FuchsiaControllerError(
+                "Fuchsia Controller FIDL Error"
+            ) from status
 
     def _read_snapshot_from_channel(self, channel_client: fcp.Channel) -> bytes:
         """Read snapshot data from client end of the transfer channel.
@@ -1175,7 +1269,7 @@ class FuchsiaDeviceImpl(
 
         # Get file size for verification later.
         try:
-            attr_resp: f_io.NodeAttributes2 = asyncio.run(
+            attr_resp: f_io.NodeAttributes2 = self._sync(
                 file_proxy.get_attributes(
                     query=f_io.NodeAttributesQuery.CONTENT_SIZE
                 )
@@ -1190,11 +1284,13 @@ class FuchsiaDeviceImpl(
             )
         expected_size: int = attr_resp.immutable_attributes.content_size
 
-        # Read until channel is empty.
+        # Read until the expected number of bytes has been received, or until
+        # the channel is empty. Stopping as soon as `expected_size` bytes are
+        # read saves the final round-trip that would only return empty data.
         ret: bytearray = bytearray()
         try:
-            while True:
-                response = asyncio.run(
+            while len(ret) < expected_size:
+                response = self._sync(
                     file_proxy.read(count=f_io.MAX_BUF)
                 ).unwrap()
                 if not response.data:
@@ -1237,7 +1333,9 @@ class FuchsiaDeviceImpl(
             )
             # The data channel isn't populated until get_snapshot() returns so
             # there's no need to drain the channel in parallel.
-            asyncio.run(feedback_proxy.get_snapshot(params=params))
+            self._sync(
+                _discard_result(feedback_proxy.get_snapshot(params=params))
+            )
         except fcp.ZxStatus as status:
             raise fc_errors.FuchsiaControllerError(
                 "get_snapshot() failed"
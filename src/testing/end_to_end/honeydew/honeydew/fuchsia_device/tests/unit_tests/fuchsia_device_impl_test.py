@@ -4,9 +4,12 @@
 """Unit tests for honeydew.fuchsia_device.fuchsia_device_impl.py."""
 
 import base64
+import functools
+import json
 import os
 import unittest
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType
 from typing import Any
 from unittest import mock
 
@@ -127,28 +130,40 @@ _INSPECT_DATA_BAD_VERSION = """
   }
 """
 
-_INPUT_ARGS: dict[str, Any] = {
-    "device_name": "fuchsia-emulator",
-    "device_serial_socket": "/tmp/socket",
-    "ffx_config_data": ffx_config.FfxConfigData(
-        isolate_dir=fuchsia_controller.IsolateDir("/tmp/isolate"),
-        logs_dir="/tmp/logs",
-        binary_path="/bin/ffx",
-        logs_level="debug",
-        mdns_enabled=False,
-        subtools_search_path=None,
-        proxy_timeout_secs=None,
-        ssh_keepalive_timeout=None,
-    ),
-}
-
-
-_MOCK_ARGS: dict[str, str] = {
-    "board": "x64",
-    "product": "core",
-    "INSPECT_DATA_JSON_TEXT": _INSPECT_DATA_JSON_TEXT,
-    "INSPECT_DATA_BAD_VERSION": _INSPECT_DATA_BAD_VERSION,
-}
+# `_INSPECT_DATA_JSON_TEXT` parsed once, for tests that only check how
+# `get_inspect_data()` reaches the parser.
+_INSPECT_DATA_LIST: list[dict[str, Any]] = json.loads(_INSPECT_DATA_JSON_TEXT)
+_INSPECT_DATA_COLLECTION: fuchsia_inspect.InspectDataCollection = (
+    fuchsia_inspect.InspectDataCollection.from_list(_INSPECT_DATA_LIST)
+)
+
+_INPUT_ARGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "device_name": "fuchsia-emulator",
+        "device_serial_socket": "/tmp/socket",
+        "ffx_config_data": ffx_config.FfxConfigData(
+            isolate_dir=fuchsia_controller.IsolateDir("/tmp/isolate"),
+            logs_dir="/tmp/logs",
+            binary_path="/bin/ffx",
+            logs_level="debug",
+            mdns_enabled=False,
+            subtools_search_path=None,
+            proxy_timeout_secs=None,
+            ssh_keepalive_timeout=None,
+        ),
+    }
+)
+
+# `DeviceInfo` is frozen, so every test device can use the same instance.
+_DEVICE_INFO: custom_types.DeviceInfo = custom_types.DeviceInfo(
+    name=_INPUT_ARGS["device_name"],
+    ip_port=None,
+    serial_socket=_INPUT_ARGS["device_serial_socket"],
+)
+
+
+_MOCK_BOARD: str = "x64"
+_MOCK_PRODUCT: str = "core"
 
 _BASE64_ENCODED_BYTES: bytes = base64.b64decode("some base64 encoded string==")
 
@@ -166,34 +181,165 @@ _MOCK_PRODUCT_INFO = f_hwinfo.ProductInfo(
     name="default-product-name",
 )
 
+_MOCK_BUILD_INFO_RESP = f_buildinfo.ProviderGetBuildInfoResponse(
+    build_info=_MOCK_BUILD_INFO,
+)
+
+_MOCK_DEVICE_INFO_RESP = f_hwinfo.DeviceGetInfoResponse(
+    info=_MOCK_DEVICE_INFO,
+)
+
+_MOCK_PRODUCT_INFO_RESP = f_hwinfo.ProductGetInfoResponse(
+    info=_MOCK_PRODUCT_INFO,
+)
+
+
+# Product info returned by the patched `FuchsiaDeviceImpl._product_info`.
+_MOCK_PRODUCT_INFO_DICT: Mapping[str, str] = MappingProxyType(
+    {
+        "manufacturer": "default-manufacturer",
+        "model": "default-model",
+        "name": "default-product-name",
+    }
+)
+
+
+class _FakePowerSwitch(power_switch_interface.PowerSwitch):
+    """PowerSwitch that records the calls made to it."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int | None]] = []
+
+    def power_off(self, outlet: int | None = None) -> None:
+        self.calls.append(("power_off", outlet))
+
+    def power_on(self, outlet: int | None = None) -> None:
+        self.calls.append(("power_on", outlet))
+
+
+class _FakeFileClient:
+    """Stand-in for `f_io.FileClient` that serves canned results.
+
+    Patch it in place of `f_io.FileClient`: constructing a client from a
+    channel returns the fake itself. Exceptions passed in as results are
+    raised instead of returned.
+    """
+
+    def __init__(
+        self,
+        attributes: f_io.NodeGetAttributesResult | BaseException,
+        reads: Iterable[f_io.ReadableReadResult | BaseException] = (),
+    ) -> None:
+        self._attributes = attributes
+        self._reads: Iterator[f_io.ReadableReadResult | BaseException] = iter(
+            reads
+        )
+
+    def __call__(self, channel: Any) -> "_FakeFileClient":
+        return self
+
+    async def get_attributes(self, **_: Any) -> f_io.NodeGetAttributesResult:
+        if isinstance(self._attributes, BaseException):
+            raise self._attributes
+        return self._attributes
+
+    async def read(self, **_: Any) -> f_io.ReadableReadResult:
+        result = next(self._reads)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
 
 def _custom_test_name_func(
     testcase_func: Callable[..., None], _: str, param_arg: param
 ) -> str:
     """Custom test name function method."""
     test_func_name: str = testcase_func.__name__
-    test_label: str
-
-    try:
-        params_dict: dict[str, Any] = param_arg.args[0]
-        test_label = parameterized.to_safe_name(params_dict["label"])
-    except Exception:  # pylint: disable=broad-except
-        test_label = parameterized.to_safe_name(param_arg.kwargs["label"])
+    label: str = (
+        param_arg.args[0]["label"]
+        if param_arg.args
+        else param_arg.kwargs["label"]
+    )
+    test_label: str = parameterized.to_safe_name(label)
 
     return f"{test_func_name}_with_{test_label}"
 
 
-def _file_read_result(data: f_io.Transfer) -> f_io.ReadableReadResult:
+def _build_fuchsia_device(
+    implementation: str,
+) -> fuchsia_device_impl.FuchsiaDeviceImpl:
+    """Build a FuchsiaDeviceImpl whose bluetooth and wlan affordances use
+    `implementation`, with the transport connection checks patched."""
+    with (
+        mock.patch.object(
+            fuchsia_controller_impl.FuchsiaControllerImpl,
+            "create_context",
+            autospec=True,
+        ) as mock_fc_create_context,
+        mock.patch.object(
+            ffx_impl.FfxImpl,
+            "check_connection",
+            autospec=True,
+        ) as mock_ffx_check_connection,
+        mock.patch.object(
+            fuchsia_controller_impl.FuchsiaControllerImpl,
+            "check_connection",
+            autospec=True,
+        ) as mock_fc_check_connection,
+        mock.patch.object(
+            sl4f_impl.Sl4fImpl,
+            "start_server",
+            autospec=True,
+        ) as mock_sl4f_start_server,
+        mock.patch.object(
+            sl4f_impl.Sl4fImpl,
+            "check_connection",
+            autospec=True,
+        ) as mock_sl4f_check_connection,
+    ):
+        fd_obj: fuchsia_device_impl.FuchsiaDeviceImpl = (
+            fuchsia_device_impl.FuchsiaDeviceImpl(
+                device_info=_DEVICE_INFO,
+                ffx_config_data=_INPUT_ARGS["ffx_config_data"],
+                config={
+                    "affordances": {
+                        "bluetooth": {
+                            "implementation": implementation,
+                        },
+                        "wlan": {
+                            "implementation": implementation,
+                        },
+                    }
+                },
+            )
+        )
+
+    mock_fc_create_context.assert_called_once_with(fd_obj.fuchsia_controller)
+    mock_fc_check_connection.assert_called()
+    mock_ffx_check_connection.assert_called()
+    if implementation == "sl4f":
+        mock_sl4f_start_server.assert_called_once_with(fd_obj.sl4f)
+        mock_sl4f_check_connection.assert_called()
+    else:
+        mock_sl4f_start_server.assert_not_called()
+        mock_sl4f_check_connection.assert_not_called()
+
+    return fd_obj
+
+
+# The FIDL results below are only ever read by the code under test, so
+# identical ones are built once and shared.
+@functools.lru_cache
+def _file_read_result(size: int) -> f_io.ReadableReadResult:
     return f_io.ReadableReadResult(
-        response=f_io.ReadableReadResponse(data=data)
+        response=f_io.ReadableReadResponse(data=[0] * size)
     )
 
 
-def _file_attr_resp(
-    status: ZxStatus, size: int
-) -> f_io.NodeGetAttributesResult:
-    if status.raw() != ZxStatus.ZX_OK:
-        return f_io.NodeGetAttributesResult(err=status.raw())
+@functools.lru_cache
+def _file_attr_resp(status: int, size: int) -> f_io.NodeGetAttributesResult:
+    if status != ZxStatus.ZX_OK:
+        return f_io.NodeGetAttributesResult(err=status)
     else:
         return f_io.NodeGetAttributesResult(
             response=f_io.NodeAttributes2(
@@ -216,120 +362,11 @@ def _file_attr_resp(
 class FuchsiaDeviceImplTests(unittest.TestCase):
     """Unit tests for honeydew.fuchsia_device.fuchsia_device_impl.py."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.fd_fc_obj: fuchsia_device_impl.FuchsiaDeviceImpl
-        super().__init__(*args, **kwargs)
+    fd_fc_obj: fuchsia_device_impl.FuchsiaDeviceImpl
 
     def setUp(self) -> None:
-        with (
-            mock.patch.object(
-                fuchsia_controller_impl.FuchsiaControllerImpl,
-                "create_context",
-                autospec=True,
-            ) as mock_fc_create_context,
-            mock.patch.object(
-                ffx_impl.FfxImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_ffx_check_connection,
-            mock.patch.object(
-                fuchsia_controller_impl.FuchsiaControllerImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_fc_check_connection,
-            mock.patch.object(
-                sl4f_impl.Sl4fImpl,
-                "start_server",
-                autospec=True,
-            ) as mock_sl4f_start_server,
-            mock.patch.object(
-                sl4f_impl.Sl4fImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_sl4f_check_connection,
-        ):
-            self.fd_fc_obj = fuchsia_device_impl.FuchsiaDeviceImpl(
-                device_info=custom_types.DeviceInfo(
-                    name=_INPUT_ARGS["device_name"],
-                    ip_port=None,
-                    serial_socket=_INPUT_ARGS["device_serial_socket"],
-                ),
-                ffx_config_data=_INPUT_ARGS["ffx_config_data"],
-                config={
-                    "affordances": {
-                        "bluetooth": {
-                            "implementation": "fuchsia-controller",
-                        },
-                        "wlan": {
-                            "implementation": "fuchsia-controller",
-                        },
-                    }
-                },
-            )
-
-            mock_fc_create_context.assert_called_once_with(
-                self.fd_fc_obj.fuchsia_controller
-            )
-            mock_fc_check_connection.assert_called()
-            mock_ffx_check_connection.assert_called()
-            mock_sl4f_start_server.assert_not_called()
-            mock_sl4f_check_connection.assert_not_called()
-
-        with (
-            mock.patch.object(
-                fuchsia_controller_impl.FuchsiaControllerImpl,
-                "create_context",
-                autospec=True,
-            ) as mock_fc_create_context,
-            mock.patch.object(
-                ffx_impl.FfxImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_ffx_check_connection,
-            mock.patch.object(
-                fuchsia_controller_impl.FuchsiaControllerImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_fc_check_connection,
-            mock.patch.object(
-                sl4f_impl.Sl4fImpl,
-                "start_server",
-                autospec=True,
-            ) as mock_sl4f_start_server,
-            mock.patch.object(
-                sl4f_impl.Sl4fImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_sl4f_check_connection,
-        ):
-            self.fd_sl4f_obj = fuchsia_device_impl.FuchsiaDeviceImpl(
-                device_info=custom_types.DeviceInfo(
-                    name=_INPUT_ARGS["device_name"],
-                    ip_port=None,
-                    serial_socket=_INPUT_ARGS["device_serial_socket"],
-                ),
-                ffx_config_data=_INPUT_ARGS["ffx_config_data"],
-                config={
-                    "affordances": {
-                        "bluetooth": {
-                            "implementation": "sl4f",
-                        },
-                        "wlan": {
-                            "implementation": "sl4f",
-                        },
-                    }
-                },
-            )
-
-            mock_fc_create_context.assert_called_once_with(
-                self.fd_sl4f_obj.fuchsia_controller
-            )
-            mock_fc_check_connection.assert_called()
-            mock_ffx_check_connection.assert_called()
-            mock_sl4f_start_server.assert_called_once_with(
-                self.fd_sl4f_obj.sl4f
-            )
-            mock_sl4f_check_connection.assert_called()
+        super().setUp()
+        self.fd_fc_obj = _build_fuchsia_device("fuchsia-controller")
 
     # List all the tests related to __init__
     def test_device_is_a_fuchsia_device(self) -> None:
@@ -337,15 +374,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         self.assertIsInstance(
             self.fd_fc_obj, fuchsia_device_interface.FuchsiaDevice
         )
-        self.assertIsInstance(
-            self.fd_sl4f_obj, fuchsia_device_interface.FuchsiaDevice
-        )
 
     # List all the tests related to transports
     @mock.patch.object(
         fastboot_impl.FastbootImpl,
         "__init__",
-        autospec=True,
         return_value=None,
     )
     def test_fastboot_transport(self, mock_fastboot_init: mock.Mock) -> None:
@@ -371,13 +404,10 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             mock.patch.object(
                 sl4f_impl.Sl4fImpl,
                 "start_server",
-                autospec=True,
             ) as mock_sl4f_start_server,
         ):
             self.assertIsInstance(self.fd_fc_obj.sl4f, sl4f_impl.Sl4fImpl)
-            mock_sl4f_start_server.assert_called_once_with(self.fd_fc_obj.sl4f)
-
-        self.assertIsInstance(self.fd_sl4f_obj.sl4f, sl4f_impl.Sl4fImpl)
+            mock_sl4f_start_server.assert_called_once_with()
 
     def test_fuchsia_controller_transport(self) -> None:
         """Test case to make sure fuchsia_device supports fuchsia-controller
@@ -398,22 +428,23 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         """Test case to make sure fuchsia_device raises error when we try to
         access "serial" transport without serial_socket."""
 
-        device_info: custom_types.DeviceInfo = self.fd_fc_obj._device_info
-
-        self.fd_fc_obj._device_info = custom_types.DeviceInfo(
-            name=_INPUT_ARGS["device_name"],
-            ip_port=None,
-            serial_socket=None,
-        )
-
-        with self.assertRaisesRegex(
-            errors.FuchsiaDeviceError,
-            "'serial_socket' arg need to be provided during the init to use Serial affordance",
+        with (
+            mock.patch.object(
+                self.fd_fc_obj,
+                "_device_info",
+                custom_types.DeviceInfo(
+                    name=_INPUT_ARGS["device_name"],
+                    ip_port=None,
+                    serial_socket=None,
+                ),
+            ),
+            self.assertRaisesRegex(
+                errors.FuchsiaDeviceError,
+                "'serial_socket' arg need to be provided during the init to use Serial affordance",
+            ),
         ):
             _: serial_interface.Serial = self.fd_fc_obj.serial
 
-        self.fd_fc_obj._device_info = device_info
-
     # List all the tests related to affordances
     def test_session(self) -> None:
         """Test case to make sure fuchsia_device supports session
@@ -443,7 +474,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ffx_impl.FfxImpl,
         "run",
         return_value="core/starnix_runner/kernels:",
-        autospec=True,
     )
     def test_system_power_state_controller(
         self,
@@ -461,7 +491,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ffx_impl.FfxImpl,
         "run",
         return_value="core/starnix_runner/kernels:",
-        autospec=True,
     )
     def test_starnix(
         self,
@@ -477,7 +506,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         rtc_using_fc.RtcUsingFc,
         "__init__",
-        autospec=True,
         return_value=None,
     )
     def test_rtc(self, mock_rtc_fc_init: mock.Mock) -> None:
@@ -488,7 +516,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             rtc_using_fc.RtcUsingFc,
         )
         mock_rtc_fc_init.assert_called_once_with(
-            self.fd_fc_obj.rtc,
             fuchsia_controller=self.fd_fc_obj.fuchsia_controller,
             reboot_affordance=self.fd_fc_obj,
         )
@@ -504,19 +531,12 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "run",
+        return_value=user_input_using_fc._INPUT_HELPER_COMPONENT,  # pylint: disable=protected-access
         autospec=True,
     )
-    def test_user_input(
-        self,
-        mock_ffx_run: mock.Mock,
-    ) -> None:
+    def test_user_input(self, *unused_args: Any) -> None:
         """Test case to make sure fuchsia_device supports
         user_input affordance."""
-
-        mock_ffx_run.return_value = (
-            user_input_using_fc._INPUT_HELPER_COMPONENT  # pylint: disable=protected-access
-        )
-
         self.assertIsInstance(
             self.fd_fc_obj.user_input,
             user_input_using_fc.UserInputUsingFc,
@@ -528,27 +548,9 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.fd_fc_obj.bluetooth_avrcp  # pylint: disable=pointless-statement
 
-    @mock.patch.object(
-        bluetooth_common_using_sl4f.BluetoothCommonUsingSl4f,
-        "__init__",
-        autospec=True,
-        return_value=None,
-    )
-    def test_bluetooth_avrcp_sl4f_impl(
-        self, mock_bluetooth_common_init: mock.Mock
-    ) -> None:
-        """Test case to make sure fuchsia_device only supports
-        SL4F based bluetooth_avrcp affordance."""
-        self.assertIsInstance(
-            self.fd_sl4f_obj.bluetooth_avrcp,
-            avrcp_using_sl4f.AvrcpUsingSl4f,
-        )
-        mock_bluetooth_common_init.assert_called_once()
-
     @mock.patch.object(
         gap_using_fc.GapUsingFc,
         "__init__",
-        autospec=True,
         return_value=None,
     )
     def test_bluetooth_gap_fc(self, bt_gap_fc_init: mock.Mock) -> None:
@@ -559,7 +561,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             gap_using_fc.GapUsingFc,
         )
         bt_gap_fc_init.assert_called_once_with(
-            self.fd_fc_obj.bluetooth_gap,
             device_name=self.fd_fc_obj._device_info.name,
             fuchsia_controller=self.fd_fc_obj.fuchsia_controller,
             reboot_affordance=self.fd_fc_obj,
@@ -574,7 +575,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         wlan_policy_using_fc.WlanPolicy,
         "__init__",
-        autospec=True,
         return_value=None,
     )
     def test_wlan_policy_using_fc(
@@ -590,7 +590,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             wlan_policy_using_fc.WlanPolicy,
         )
         wlan_policy_using_fc_init.assert_called_once_with(
-            self.fd_fc_obj.wlan_policy,
             device_name=self.fd_fc_obj._device_info.name,
             ffx=self.fd_fc_obj.ffx,
             fuchsia_controller=self.fd_fc_obj.fuchsia_controller,
@@ -607,7 +606,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         wlan_core_using_fc.WlanCore,
         "__init__",
-        autospec=True,
         return_value=None,
     )
     def test_wlan_core_using_fc(
@@ -623,7 +621,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             wlan_core_using_fc.WlanCore,
         )
         wlan_core_using_fc_init.assert_called_once_with(
-            self.fd_fc_obj.wlan_core,
             device_name=self.fd_fc_obj._device_info.name,
             ffx=self.fd_fc_obj.ffx,
             fuchsia_controller=self.fd_fc_obj.fuchsia_controller,
@@ -635,22 +632,17 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "get_target_board",
-        return_value=_MOCK_ARGS["board"],
-        autospec=True,
+        return_value=_MOCK_BOARD,
     )
     def test_board(self, mock_ffx_get_target_board: mock.Mock) -> None:
         """Testcase for BaseFuchsiaDevice.board property"""
-        self.assertEqual(self.fd_fc_obj.board, _MOCK_ARGS["board"])
+        self.assertEqual(self.fd_fc_obj.board, _MOCK_BOARD)
         mock_ffx_get_target_board.assert_called()
 
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_product_info",
-        return_value={
-            "manufacturer": "default-manufacturer",
-            "model": "default-model",
-            "name": "default-product-name",
-        },
+        return_value=_MOCK_PRODUCT_INFO_DICT,
         new_callable=mock.PropertyMock,
     )
     def test_manufacturer(self, *unused_args: Any) -> None:
@@ -660,11 +652,7 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_product_info",
-        return_value={
-            "manufacturer": "default-manufacturer",
-            "model": "default-model",
-            "name": "default-product-name",
-        },
+        return_value=_MOCK_PRODUCT_INFO_DICT,
         new_callable=mock.PropertyMock,
     )
     def test_model(self, *unused_args: Any) -> None:
@@ -674,22 +662,17 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "get_target_product",
-        return_value=_MOCK_ARGS["product"],
-        autospec=True,
+        return_value=_MOCK_PRODUCT,
     )
     def test_product(self, mock_ffx_get_target_product: mock.Mock) -> None:
         """Testcase for BaseFuchsiaDevice.product property"""
-        self.assertEqual(self.fd_fc_obj.product, _MOCK_ARGS["product"])
+        self.assertEqual(self.fd_fc_obj.product, _MOCK_PRODUCT)
         mock_ffx_get_target_product.assert_called()
 
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_product_info",
-        return_value={
-            "manufacturer": "default-manufacturer",
-            "model": "default-model",
-            "name": "default-product-name",
-        },
+        return_value=_MOCK_PRODUCT_INFO_DICT,
         new_callable=mock.PropertyMock,
     )
     def test_product_name(self, *unused_args: Any) -> None:
@@ -772,9 +755,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         parameterized_dict: dict[str, Any],
     ) -> None:
         """Testcase for FuchsiaDevice.close()"""
-        # Reset the `_on_device_close_fns` variable at the beginning of the test
-        self.fd_fc_obj._on_device_close_fns = []
-
         if parameterized_dict["register_for_on_device_close"]:
             self.fd_fc_obj.register_for_on_device_close(
                 parameterized_dict["register_for_on_device_close"]
@@ -785,78 +765,87 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         else:
             self.fd_fc_obj.close()
 
-        # Reset the `_on_device_close_fns` variable at the end of the test
-        self.fd_fc_obj._on_device_close_fns = []
+    def test_close_closes_event_loop(self) -> None:
+        """Testcase for FuchsiaDevice.close() closing the event loop"""
+        loop = self.fd_fc_obj._loop
+
+        self.fd_fc_obj.close()
+
+        self.assertTrue(loop.is_closed())
+        self.assertIsNot(self.fd_fc_obj._loop, loop)
+
+    def test_close_without_event_loop(self) -> None:
+        """Testcase for FuchsiaDevice.close() when the event loop was never
+        created"""
+        self.fd_fc_obj.__dict__.pop("_loop", None)
+
+        self.fd_fc_obj.close()
+
+        self.assertNotIn("_loop", self.fd_fc_obj.__dict__)
 
     @mock.patch.object(
-        sl4f_impl.Sl4fImpl,
-        "check_connection",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "check_connection",
-        autospec=True,
+        fd_remotecontrol.RemoteControlClient,
+        "log_message",
+        new_callable=mock.AsyncMock,
     )
-    @mock.patch.object(ffx_impl.FfxImpl, "check_connection", autospec=True)
-    def test_health_check_fc(
-        self,
-        mock_ffx_check_connection: mock.Mock,
-        mock_fc_check_connection: mock.Mock,
-        mock_sl4f_check_connection: mock.Mock,
+    def test_send_log_command_after_close(
+        self, mock_rcs_log_message: mock.Mock
     ) -> None:
-        """Testcase for FuchsiaDevice.health_check() when transport is set to
-        Fuchsia-Controller"""
-        self.fd_fc_obj.health_check()
-        mock_ffx_check_connection.assert_called_once_with(self.fd_fc_obj.ffx)
-        mock_fc_check_connection.assert_called_once_with(
-            self.fd_fc_obj.fuchsia_controller
+        """Testcase to make sure FuchsiaDevice._send_log_command() reconnects to
+        RemoteControl after FuchsiaDevice.close()"""
+        self.fd_fc_obj.fuchsia_controller.ctx = mock.Mock()
+
+        # pylint: disable=protected-access
+        self.fd_fc_obj._send_log_command(
+            tag="test", level=custom_types.LEVEL.INFO, message="test"
+        )
+        self.fd_fc_obj.close()
+        self.assertIsNone(self.fd_fc_obj._rcs_client)
+
+        self.fd_fc_obj._send_log_command(
+            tag="test", level=custom_types.LEVEL.INFO, message="test"
+        )
+
+        self.assertEqual(mock_rcs_log_message.call_count, 2)
+        self.assertEqual(
+            self.fd_fc_obj.fuchsia_controller.ctx.connect_remote_control_proxy.call_count,
+            2,
         )
-        mock_sl4f_check_connection.assert_not_called()
 
     @mock.patch.object(
         sl4f_impl.Sl4fImpl,
         "check_connection",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "check_connection",
-        autospec=True,
     )
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "check_connection",
-        autospec=True,
     )
-    def test_health_check_sl4f(
+    def test_health_check(
         self,
         mock_ffx_check_connection: mock.Mock,
         mock_fc_check_connection: mock.Mock,
         mock_sl4f_check_connection: mock.Mock,
     ) -> None:
         """Testcase for FuchsiaDevice.health_check() when transport is set to
-        Fuchsia-Controller-Preferred"""
-        self.fd_sl4f_obj.health_check()
+        Fuchsia-Controller"""
+        self.fd_fc_obj.health_check()
 
-        mock_ffx_check_connection.assert_called_once_with(self.fd_sl4f_obj.ffx)
-        mock_fc_check_connection.assert_called_once_with(
-            self.fd_sl4f_obj.fuchsia_controller
-        )
-        mock_sl4f_check_connection.assert_called_once_with(
-            self.fd_sl4f_obj.sl4f
-        )
+        mock_ffx_check_connection.assert_called_once_with()
+        mock_fc_check_connection.assert_called_once_with()
+        mock_sl4f_check_connection.assert_not_called()
 
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "check_connection",
-        autospec=True,
     )
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "check_connection",
         side_effect=ffx_errors.FfxConnectionError("ffx connection error"),
-        autospec=True,
     )
     def test_health_check_exception(
         self,
@@ -867,7 +856,7 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         with self.assertRaises(errors.HealthCheckError):
             self.fd_fc_obj.health_check()
 
-        mock_ffx_check_connection.assert_called_once_with(self.fd_fc_obj.ffx)
+        mock_ffx_check_connection.assert_called_once_with()
         mock_fc_check_connection.assert_not_called()
 
     @parameterized.expand(
@@ -936,6 +925,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ],
         name_func=_custom_test_name_func,
     )
+    @mock.patch.object(
+        fuchsia_inspect.InspectDataCollection,
+        "from_list",
+        return_value=_INSPECT_DATA_COLLECTION,
+    )
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "run",
@@ -944,13 +938,14 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     def test_get_inspect_data(
         self,
         mock_ffx_run: mock.Mock,
+        mock_from_list: mock.Mock,
         label: str,  # pylint: disable=unused-argument
         selectors: list[str],
         monikers: list[str],
         expected_cmd: list[str],
     ) -> None:
         """Test case for get_inspect_data()"""
-        mock_ffx_run.return_value = _MOCK_ARGS["INSPECT_DATA_JSON_TEXT"]
+        mock_ffx_run.return_value = _INSPECT_DATA_JSON_TEXT
 
         inspect_data_collection: fuchsia_inspect.InspectDataCollection = (
             self.fd_fc_obj.get_inspect_data(
@@ -959,17 +954,38 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
             )
         )
 
+        self.assertIs(inspect_data_collection, _INSPECT_DATA_COLLECTION)
+        mock_from_list.assert_called_once_with(_INSPECT_DATA_LIST)
+        mock_ffx_run.assert_called_with(
+            self.fd_fc_obj.ffx,
+            cmd=expected_cmd,
+            log_output=False,
+        )
+
+    @mock.patch.object(
+        ffx_impl.FfxImpl,
+        "run",
+        return_value=_INSPECT_DATA_JSON_TEXT,
+        autospec=True,
+    )
+    def test_get_inspect_data_parses_ffx_output(
+        self,
+        mock_ffx_run: mock.Mock,
+    ) -> None:
+        """Test case for get_inspect_data() turning the output of
+        `ffx inspect show` into an InspectDataCollection"""
+        inspect_data_collection: fuchsia_inspect.InspectDataCollection = (
+            self.fd_fc_obj.get_inspect_data()
+        )
+
         self.assertIsInstance(
             inspect_data_collection, fuchsia_inspect.InspectDataCollection
         )
         for inspect_data in inspect_data_collection.data:
             self.assertIsInstance(inspect_data, fuchsia_inspect.InspectData)
+        self.assertEqual(inspect_data_collection, _INSPECT_DATA_COLLECTION)
 
-        mock_ffx_run.assert_called_with(
-            mock.ANY,
-            cmd=expected_cmd,
-            log_output=False,
-        )
+        mock_ffx_run.assert_called_once()
 
     @parameterized.expand(
         [
@@ -991,69 +1007,37 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ],
         name_func=_custom_test_name_func,
     )
-    @mock.patch.object(
-        ffx_impl.FfxImpl,
-        "run",
-        autospec=True,
-    )
     def test_get_inspect_data_exception_when_ffx_run_fails(
         self,
-        mock_ffx_run: mock.Mock,
         label: str,  # pylint: disable=unused-argument,
         side_effect: type[errors.HoneydewError],
         expected_error: type[errors.HoneydewError],
     ) -> None:
         """Test case for get_inspect_data() raising InspectError failure."""
-        mock_ffx_run.side_effect = side_effect
-
-        with self.assertRaises(expected_error):
+        with (
+            mock.patch.object(
+                ffx_impl.FfxImpl, "run", side_effect=side_effect
+            ) as mock_ffx_run,
+            self.assertRaises(expected_error),
+        ):
             self.fd_fc_obj.get_inspect_data()
 
         mock_ffx_run.assert_called_once()
 
-    @mock.patch.object(
-        ffx_impl.FfxImpl,
-        "run",
-        autospec=True,
-    )
     def test_get_inspect_data_exception_when_inspect_data_parsing_fails(
         self,
-        mock_ffx_run: mock.Mock,
     ) -> None:
         """Test case for get_inspect_data() raising InspectError failure."""
-        mock_ffx_run.return_value = _MOCK_ARGS["INSPECT_DATA_BAD_VERSION"]
-
-        with self.assertRaises(errors.InspectError):
+        with (
+            mock.patch.object(
+                ffx_impl.FfxImpl, "run", return_value=_INSPECT_DATA_BAD_VERSION
+            ) as mock_ffx_run,
+            self.assertRaises(errors.InspectError),
+        ):
             self.fd_fc_obj.get_inspect_data()
 
         mock_ffx_run.assert_called_once()
 
-    @parameterized.expand(
-        [
-            (
-                {
-                    "label": "info_level",
-                    "log_level": custom_types.LEVEL.INFO,
-                    "log_message": "info message",
-                },
-            ),
-            (
-                {
-                    "label": "warning_level",
-                    "log_level": custom_types.LEVEL.WARNING,
-                    "log_message": "warning message",
-                },
-            ),
-            (
-                {
-                    "label": "error_level",
-                    "log_level": custom_types.LEVEL.ERROR,
-                    "log_message": "error message",
-                },
-            ),
-        ],
-        name_func=_custom_test_name_func,
-    )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_send_log_command",
@@ -1061,21 +1045,32 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     )
     def test_log_message_to_device(
         self,
-        parameterized_dict: dict[str, Any],
         mock_send_log_command: mock.Mock,
     ) -> None:
         """Testcase for BaseFuchsiaDevice.log_message_to_device()"""
-        self.fd_fc_obj.log_message_to_device(
-            level=parameterized_dict["log_level"],
-            message=parameterized_dict["log_message"],
-        )
-
-        mock_send_log_command.assert_called_with(
-            self.fd_fc_obj,
-            tag="lacewing",
-            message=mock.ANY,
-            level=parameterized_dict["log_level"],
-        )
+        for log_level, log_message in (
+            (custom_types.LEVEL.INFO, "info message"),
+            (custom_types.LEVEL.WARNING, "warning message"),
+            (custom_types.LEVEL.ERROR, "error message"),
+        ):
+            with self.subTest(level=log_level):
+                mock_send_log_command.reset_mock()
+
+                self.fd_fc_obj.log_message_to_device(
+                    level=log_level,
+                    message=log_message,
+                )
+
+                mock_send_log_command.assert_called_once()
+                args, kwargs = mock_send_log_command.call_args
+                self.assertEqual(args, (self.fd_fc_obj,))
+                self.assertEqual(kwargs["tag"], "lacewing")
+                self.assertEqual(kwargs["level"], log_level)
+                # The message is prefixed with the host time it was sent at.
+                self.assertRegex(
+                    kwargs["message"],
+                    rf"^\[Host Time: \S+\] - {log_message}$",
+                )
 
     @parameterized.expand(
         [
@@ -1104,17 +1099,16 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         name_func=_custom_test_name_func,
     )
     @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl, "health_check", autospec=True
+        fuchsia_device_impl.FuchsiaDeviceImpl,
+        "health_check",
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "create_context",
-        autospec=True,
     )
     @mock.patch.object(
         sl4f_impl.Sl4fImpl,
         "start_server",
-        autospec=True,
     )
     def test_on_device_boot_fc(
         self,
@@ -1125,9 +1119,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     ) -> None:
         """Testcase for BaseFuchsiaDevice.on_device_boot() when transport is set to
         Fuchsia-Controller"""
-        # Reset the `_on_device_boot_fns` variable at the beginning of the test
-        self.fd_fc_obj._on_device_boot_fns = []
-
         if parameterized_dict["register_for_on_device_boot"]:
             self.fd_fc_obj.register_for_on_device_boot(
                 parameterized_dict["register_for_on_device_boot"]
@@ -1138,59 +1129,25 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         else:
             self.fd_fc_obj.on_device_boot()
 
-        # Reset the `_on_device_boot_fns` variable at the end of the test
-        self.fd_fc_obj._on_device_boot_fns = []
-
         mock_fc_create_context.assert_called_once()
         mock_health_check.assert_called_once()
         mock_sl4f_start_server.assert_not_called()
 
     @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl, "health_check", autospec=True
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
-    @mock.patch.object(
-        sl4f_impl.Sl4fImpl,
-        "start_server",
-        autospec=True,
-    )
-    def test_on_device_boot(
-        self,
-        mock_sl4f_start_server: mock.Mock,
-        mock_fc_create_context: mock.Mock,
-        mock_sl4f_health_check: mock.Mock,
-    ) -> None:
-        """Testcase for FuchsiaDevice.on_device_boot() when transport is set to
-        Fuchsia-Controller-Preferred"""
-        self.fd_sl4f_obj.on_device_boot()
-
-        mock_sl4f_start_server.assert_called_once_with(self.fd_sl4f_obj.sl4f)
-        mock_fc_create_context.assert_called_once_with(
-            self.fd_sl4f_obj.fuchsia_controller
-        )
-        mock_sl4f_health_check.assert_called_once_with(self.fd_sl4f_obj)
-
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl, "on_device_boot", autospec=True
+        fuchsia_device_impl.FuchsiaDeviceImpl,
+        "on_device_boot",
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "wait_for_online",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "wait_for_offline",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "log_message_to_device",
-        autospec=True,
     )
     def test_power_cycle(
         self,
@@ -1200,36 +1157,36 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         mock_on_device_boot: mock.Mock,
     ) -> None:
         """Testcase for BaseFuchsiaDevice.power_cycle()"""
-        power_switch = mock.MagicMock(spec=power_switch_interface.PowerSwitch)
+        power_switch = _FakePowerSwitch()
         self.fd_fc_obj.power_cycle(power_switch=power_switch, outlet=5)
 
+        self.assertEqual(
+            power_switch.calls, [("power_off", 5), ("power_on", 5)]
+        )
         self.assertEqual(mock_log_message_to_device.call_count, 2)
         mock_wait_for_offline.assert_called()
         mock_wait_for_online.assert_called()
         mock_on_device_boot.assert_called()
 
     @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl, "on_device_boot", autospec=True
+        fuchsia_device_impl.FuchsiaDeviceImpl,
+        "on_device_boot",
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "wait_for_online",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "wait_for_offline",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_send_reboot_command",
-        autospec=True,
     )
     @mock.patch.object(
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "log_message_to_device",
-        autospec=True,
     )
     def test_reboot(
         self,
@@ -1282,9 +1239,8 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         fuchsia_device_impl.FuchsiaDeviceImpl,
         "_send_snapshot_command",
         return_value=_BASE64_ENCODED_BYTES,
-        autospec=True,
     )
-    @mock.patch.object(os, "makedirs", autospec=True)
+    @mock.patch.object(os, "makedirs")
     def test_snapshot(
         self,
         parameterized_dict: dict[str, Any],
@@ -1319,7 +1275,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "wait_for_rcs_disconnection",
-        autospec=True,
     )
     def test_wait_for_offline_success(
         self, mock_ffx_wait_for_rcs_disconnection: mock.Mock
@@ -1333,23 +1288,20 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ffx_impl.FfxImpl,
         "wait_for_rcs_disconnection",
         side_effect=ffx_errors.FfxCommandError("error"),
-        autospec=True,
     )
     def test_wait_for_offline_fail(
         self, mock_ffx_wait_for_rcs_disconnection: mock.Mock
     ) -> None:
         """Testcase for BaseFuchsiaDevice.wait_for_offline() failure case"""
-        with self.assertRaisesRegex(
-            errors.FuchsiaDeviceError, "failed to go offline"
-        ):
+        with self.assertRaises(errors.FuchsiaDeviceError) as cm:
             self.fd_fc_obj.wait_for_offline()
+        self.assertIn("failed to go offline", str(cm.exception))
 
         mock_ffx_wait_for_rcs_disconnection.assert_called()
 
     @mock.patch.object(
         ffx_impl.FfxImpl,
         "wait_for_rcs_connection",
-        autospec=True,
     )
     def test_wait_for_online_success(
         self, mock_ffx_wait_for_rcs_connection: mock.Mock
@@ -1363,16 +1315,14 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         ffx_impl.FfxImpl,
         "wait_for_rcs_connection",
         side_effect=ffx_errors.FfxCommandError("error"),
-        autospec=True,
     )
     def test_wait_for_online_fail(
         self, mock_ffx_wait_for_rcs_connection: mock.Mock
     ) -> None:
         """Testcase for BaseFuchsiaDevice.wait_for_online() failure case"""
-        with self.assertRaisesRegex(
-            errors.FuchsiaDeviceError, "failed to go online"
-        ):
+        with self.assertRaises(errors.FuchsiaDeviceError) as cm:
             self.fd_fc_obj.wait_for_online()
+        self.assertIn("failed to go online", str(cm.exception))
 
         mock_ffx_wait_for_rcs_connection.assert_called()
 
@@ -1381,14 +1331,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_buildinfo.ProviderClient,
         "get_build_info",
         new_callable=mock.AsyncMock,
-        return_value=f_buildinfo.ProviderGetBuildInfoResponse(
-            build_info=_MOCK_BUILD_INFO
-        ),
+        return_value=_MOCK_BUILD_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_build_info(
         self,
@@ -1406,14 +1353,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_buildinfo.ProviderClient,
         "get_build_info",
         new_callable=mock.AsyncMock,
-        return_value=f_buildinfo.ProviderGetBuildInfoResponse(
-            build_info=_MOCK_BUILD_INFO
-        ),
+        return_value=_MOCK_BUILD_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_build_info_error(
         self,
@@ -1436,12 +1380,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_hwinfo.DeviceClient,
         "get_info",
         new_callable=mock.AsyncMock,
-        return_value=f_hwinfo.DeviceGetInfoResponse(info=_MOCK_DEVICE_INFO),
+        return_value=_MOCK_DEVICE_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_device_info_from_fidl(
         self,
@@ -1462,12 +1405,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_hwinfo.DeviceClient,
         "get_info",
         new_callable=mock.AsyncMock,
-        return_value=f_hwinfo.DeviceGetInfoResponse(info=_MOCK_DEVICE_INFO),
+        return_value=_MOCK_DEVICE_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_device_info_from_fidl_error(
         self,
@@ -1488,12 +1430,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_hwinfo.ProductClient,
         "get_info",
         new_callable=mock.AsyncMock,
-        return_value=f_hwinfo.ProductGetInfoResponse(info=_MOCK_PRODUCT_INFO),
+        return_value=_MOCK_PRODUCT_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_product_info(
         self,
@@ -1514,12 +1455,11 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         f_hwinfo.ProductClient,
         "get_info",
         new_callable=mock.AsyncMock,
-        return_value=f_hwinfo.ProductGetInfoResponse(info=_MOCK_PRODUCT_INFO),
+        return_value=_MOCK_PRODUCT_INFO_RESP,
     )
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_product_info_error(
         self,
@@ -1606,6 +1546,31 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
                 tag="test", level=custom_types.LEVEL.ERROR, message="test"
             )
 
+        # Failed call is retried once on a fresh connection.
+        self.assertEqual(mock_rcs_log_message.call_count, 2)
+        self.assertIsNone(self.fd_fc_obj._rcs_client)
+
+    @mock.patch.object(
+        fd_remotecontrol.RemoteControlClient,
+        "log_message",
+        new_callable=mock.AsyncMock,
+    )
+    def test_send_log_command_reuses_rcs_client(
+        self, mock_rcs_log_message: mock.Mock
+    ) -> None:
+        """Testcase to make sure FuchsiaDevice._send_log_command() connects to
+        RemoteControl only once across multiple calls."""
+        self.fd_fc_obj.fuchsia_controller.ctx = mock.Mock()
+
+        # pylint: disable=protected-access
+        for _ in range(2):
+            self.fd_fc_obj._send_log_command(
+                tag="test", level=custom_types.LEVEL.INFO, message="test"
+            )
+
+        self.assertEqual(mock_rcs_log_message.call_count, 2)
+        self.fd_fc_obj.fuchsia_controller.ctx.connect_remote_control_proxy.assert_called_once()
+
     @mock.patch.object(
         fhp_statecontrol.AdminClient,
         "perform_reboot",
@@ -1614,7 +1579,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_send_reboot_command(
         self,
@@ -1636,7 +1600,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_send_reboot_command_error(
         self,
@@ -1664,7 +1627,6 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
     @mock.patch.object(
         fuchsia_controller_impl.FuchsiaControllerImpl,
         "connect_device_proxy",
-        autospec=True,
     )
     def test_send_reboot_command_error_is_peer_closed(
         self,
@@ -1684,57 +1646,98 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         mock_admin_perform_reboot.assert_called()
 
     @mock.patch.object(
-        f_feedback.DataProviderClient,
-        "get_snapshot",
-        new_callable=mock.AsyncMock,
-    )
-    @mock.patch.object(
-        f_io.FileClient,
-        "get_attributes",
-        new_callable=mock.AsyncMock,
-        return_value=_file_attr_resp(ZxStatus(ZxStatus.ZX_OK), 15),
-    )
-    @mock.patch.object(
-        f_io.FileClient,
-        "read",
-        new_callable=mock.AsyncMock,
-        side_effect=[
-            # Read 15 bytes over multiple responses.
-            _file_read_result([0] * 5),
-            _file_read_result([0] * 5),
-            _file_read_result([0] * 5),
-            # Send empty response to signal read completion.
-            _file_read_result([]),
-        ],
+        ffx_impl.FfxImpl,
+        "run",
+        return_value="core/starnix_runner/kernels:",
+        autospec=True,
     )
+    def test_is_starnix_device(self, mock_ffx: mock.Mock) -> None:
+        """Testcase for FuchsiaDevice.is_starnix_device()"""
+        self.assertTrue(self.fd_fc_obj.is_starnix_device())
+
+        mock_ffx.assert_called_once()
+
     @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
+        ffx_impl.FfxImpl,
+        "run",
+        return_value="",
         autospec=True,
     )
+    def test_is_starnix_device_unsupported_error(
+        self, mock_ffx: mock.Mock
+    ) -> None:
+        """Testcase for FuchsiaDevice.is_starnix_device()"""
+        self.assertFalse(self.fd_fc_obj.is_starnix_device())
+
+        mock_ffx.assert_called_once()
+
     @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
+        ffx_impl.FfxImpl,
+        "run",
+        side_effect=ffx_errors.FfxCommandError("error"),
         autospec=True,
     )
+    def test_is_starnix_device_error(self, mock_ffx: mock.Mock) -> None:
+        """Testcase for FuchsiaDevice.is_starnix_device()"""
+        with self.assertRaises(errors.FuchsiaDeviceError):
+            self.fd_fc_obj.is_starnix_device()
+
+        mock_ffx.assert_called_once()
+
+
+class FuchsiaDeviceImplSnapshotCommandTests(unittest.TestCase):
+    """Unit tests for FuchsiaDeviceImpl._send_snapshot_command()."""
+
+    fd_fc_obj: fuchsia_device_impl.FuchsiaDeviceImpl
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fd_fc_obj = _build_fuchsia_device("fuchsia-controller")
+
+        # Patches shared by every test in this class. Only the FIDL calls whose
+        # behavior differs between tests are patched per test.
+        health_check_patcher = mock.patch.object(
+            fuchsia_device_impl.FuchsiaDeviceImpl,
+            "health_check",
+        )
+        health_check_patcher.start()
+        self.addCleanup(health_check_patcher.stop)
+
+        connect_device_proxy_patcher = mock.patch.object(
+            fuchsia_controller_impl.FuchsiaControllerImpl,
+            "connect_device_proxy",
+        )
+        self.mock_fc_connect_device_proxy: mock.MagicMock = (
+            connect_device_proxy_patcher.start()
+        )
+        self.addCleanup(connect_device_proxy_patcher.stop)
+
     @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
+        f_feedback.DataProviderClient,
+        "get_snapshot",
+        new_callable=mock.AsyncMock,
     )
     def test_send_snapshot_command(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command()"""
-        # pylint: disable=protected-access
-        data = self.fd_fc_obj._send_snapshot_command()
+        file_client = _FakeFileClient(
+            attributes=_file_attr_resp(ZxStatus.ZX_OK, 15),
+            # Read 15 bytes over multiple responses. No empty response is
+            # needed as reading stops once the content size has been read.
+            reads=[
+                _file_read_result(5),
+                _file_read_result(5),
+                _file_read_result(5),
+            ],
+        )
+        with mock.patch.object(f_io, "FileClient", file_client):
+            # pylint: disable=protected-access
+            data = self.fd_fc_obj._send_snapshot_command()
         self.assertEqual(len(data), 15)
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
 
     @mock.patch.object(
         f_feedback.DataProviderClient,
@@ -1743,26 +1746,8 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         # Raise arbitrary failure.
         side_effect=ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS),
     )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
     def test_send_snapshot_command_get_snapshot_error(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command() when the
@@ -1772,231 +1757,199 @@ class FuchsiaDeviceImplTests(unittest.TestCase):
         with self.assertRaises(fc_errors.FuchsiaControllerError):
             self.fd_fc_obj._send_snapshot_command()
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
 
     @mock.patch.object(
         f_feedback.DataProviderClient,
         "get_snapshot",
         new_callable=mock.AsyncMock,
     )
-    @mock.patch.object(
-        f_io.FileClient,
-        "get_attributes",
-        new_callable=mock.AsyncMock,
-        # Raise arbitrary failure.
-        side_effect=ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS),
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
     def test_send_snapshot_command_get_attributes_error(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command() when the get_attributes
         FIDL call raises an exception.
         ZX_ERR_INVALID_ARGS was chosen arbitrarily for this purpose."""
-        # pylint: disable=protected-access
-        with self.assertRaises(fc_errors.FuchsiaControllerError):
+        file_client = _FakeFileClient(
+            # Raise arbitrary failure.
+            attributes=ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS),
+        )
+        with (
+            mock.patch.object(f_io, "FileClient", file_client),
+            self.assertRaises(fc_errors.FuchsiaControllerError),
+        ):
+            # pylint: disable=protected-access
             self.fd_fc_obj._send_snapshot_command()
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
 
     @mock.patch.object(
         f_feedback.DataProviderClient,
         "get_snapshot",
         new_callable=mock.AsyncMock,
     )
-    @mock.patch.object(
-        f_io.FileClient,
-        "get_attributes",
-        new_callable=mock.AsyncMock,
-        return_value=_file_attr_resp(ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS), 0),
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
     def test_send_snapshot_command_get_attributes_status_not_ok(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command() when the get_attributes
         FIDL call returns a non-OK status code.
         ZX_ERR_INVALID_ARGS was chosen arbitrarily for this purpose."""
-        # pylint: disable=protected-access
-        with self.assertRaises(fc_errors.FuchsiaControllerError):
+        file_client = _FakeFileClient(
+            attributes=_file_attr_resp(ZxStatus.ZX_ERR_INVALID_ARGS, 0),
+        )
+        with (
+            mock.patch.object(f_io, "FileClient", file_client),
+            self.assertRaises(fc_errors.FuchsiaControllerError),
+        ):
+            # pylint: disable=protected-access
             self.fd_fc_obj._send_snapshot_command()
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
 
     @mock.patch.object(
         f_feedback.DataProviderClient,
         "get_snapshot",
         new_callable=mock.AsyncMock,
     )
-    @mock.patch.object(
-        f_io.FileClient,
-        "get_attributes",
-        new_callable=mock.AsyncMock,
-        return_value=_file_attr_resp(ZxStatus(ZxStatus.ZX_OK), 15),
-    )
-    @mock.patch.object(
-        f_io.FileClient,
-        "read",
-        new_callable=mock.AsyncMock,
-        side_effect=ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS),
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
     def test_send_snapshot_command_read_error(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command() when the read
         FIDL call raises an exception.
         ZX_ERR_INVALID_ARGS was chosen arbitrarily for this purpose."""
-        # pylint: disable=protected-access
-        with self.assertRaises(fc_errors.FuchsiaControllerError):
+        file_client = _FakeFileClient(
+            attributes=_file_attr_resp(ZxStatus.ZX_OK, 15),
+            reads=[ZxStatus(ZxStatus.ZX_ERR_INVALID_ARGS)],
+        )
+        with (
+            mock.patch.object(f_io, "FileClient", file_client),
+            self.assertRaises(fc_errors.FuchsiaControllerError),
+        ):
+            # pylint: disable=protected-access
             self.fd_fc_obj._send_snapshot_command()
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
 
     @mock.patch.object(
         f_feedback.DataProviderClient,
         "get_snapshot",
         new_callable=mock.AsyncMock,
     )
-    @mock.patch.object(
-        f_io.FileClient,
-        "get_attributes",
-        new_callable=mock.AsyncMock,
-        # File reports size of 15 bytes.
-        return_value=_file_attr_resp(ZxStatus(ZxStatus.ZX_OK), 15),
-    )
-    @mock.patch.object(
-        f_io.FileClient,
-        "read",
-        new_callable=mock.AsyncMock,
-        # Only 5 bytes are read.
-        side_effect=[
-            _file_read_result([0] * 5),
-            _file_read_result([]),
-        ],
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "connect_device_proxy",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_device_impl.FuchsiaDeviceImpl,
-        "health_check",
-        autospec=True,
-    )
-    @mock.patch.object(
-        fuchsia_controller_impl.FuchsiaControllerImpl,
-        "create_context",
-        autospec=True,
-    )
     def test_send_snapshot_command_size_mismatch(
         self,
-        unused_mock_fc_create_context: mock.Mock,
-        unused_mock_health_check: mock.Mock,
-        mock_fc_connect_device_proxy: mock.Mock,
         *unused_args: Any,
     ) -> None:
         """Testcase for FuchsiaDevice._send_snapshot_command() when the number
         of bytes read from channel doesn't match the file's content size."""
-        # pylint: disable=protected-access
-        with self.assertRaises(fc_errors.FuchsiaControllerError):
+        file_client = _FakeFileClient(
+            # File reports size of 15 bytes.
+            attributes=_file_attr_resp(ZxStatus.ZX_OK, 15),
+            # Only 5 bytes are read.
+            reads=[
+                _file_read_result(5),
+                _file_read_result(0),
+            ],
+        )
+        with (
+            mock.patch.object(f_io, "FileClient", file_client),
+            self.assertRaises(fc_errors.FuchsiaControllerError),
+        ):
+            # pylint: disable=protected-access
             self.fd_fc_obj._send_snapshot_command()
 
-        mock_fc_connect_device_proxy.assert_called()
+        self.mock_fc_connect_device_proxy.assert_called()
+
+
+class FuchsiaDeviceImplSl4fTests(unittest.TestCase):
+    """Unit tests for honeydew.fuchsia_device.fuchsia_device_impl.py when
+    affordances are configured to use SL4F."""
+
+    fd_sl4f_obj: fuchsia_device_impl.FuchsiaDeviceImpl
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fd_sl4f_obj = _build_fuchsia_device("sl4f")
+
+    def test_device_is_a_fuchsia_device(self) -> None:
+        """Test case to make sure DUT is a fuchsia device"""
+        self.assertIsInstance(
+            self.fd_sl4f_obj, fuchsia_device_interface.FuchsiaDevice
+        )
+
+    def test_sl4f_impl(self) -> None:
+        """Test case to make sure fuchsia_device supports sl4f transport."""
+        self.assertIsInstance(self.fd_sl4f_obj.sl4f, sl4f_impl.Sl4fImpl)
 
     @mock.patch.object(
-        ffx_impl.FfxImpl,
-        "run",
-        return_value="core/starnix_runner/kernels:",
-        autospec=True,
+        bluetooth_common_using_sl4f.BluetoothCommonUsingSl4f,
+        "__init__",
+        return_value=None,
     )
-    def test_is_starnix_device(self, mock_ffx: mock.Mock) -> None:
-        """Testcase for FuchsiaDevice.is_starnix_device()"""
-        self.assertTrue(self.fd_fc_obj.is_starnix_device())
-
-        mock_ffx.assert_called_once()
+    def test_bluetooth_avrcp_sl4f_impl(
+        self, mock_bluetooth_common_init: mock.Mock
+    ) -> None:
+        """Test case to make sure fuchsia_device only supports
+        SL4F based bluetooth_avrcp affordance."""
+        self.assertIsInstance(
+            self.fd_sl4f_obj.bluetooth_avrcp,
+            avrcp_using_sl4f.AvrcpUsingSl4f,
+        )
+        mock_bluetooth_common_init.assert_called_once()
 
+    @mock.patch.object(
+        sl4f_impl.Sl4fImpl,
+        "check_connection",
+    )
+    @mock.patch.object(
+        fuchsia_controller_impl.FuchsiaControllerImpl,
+        "check_connection",
+    )
     @mock.patch.object(
         ffx_impl.FfxImpl,
-        "run",
-        return_value="",
-        autospec=True,
+        "check_connection",
     )
-    def test_is_starnix_device_unsupported_error(
-        self, mock_ffx: mock.Mock
+    def test_health_check(
+        self,
+        mock_ffx_check_connection: mock.Mock,
+        mock_fc_check_connection: mock.Mock,
+        mock_sl4f_check_connection: mock.Mock,
     ) -> None:
-        """Testcase for FuchsiaDevice.is_starnix_device()"""
-        self.assertFalse(self.fd_fc_obj.is_starnix_device())
+        """Testcase for FuchsiaDevice.health_check() when transport is set to
+        Fuchsia-Controller-Preferred"""
+        self.fd_sl4f_obj.health_check()
 
-        mock_ffx.assert_called_once()
+        mock_ffx_check_connection.assert_called_once_with()
+        mock_fc_check_connection.assert_called_once_with()
+        mock_sl4f_check_connection.assert_called_once_with()
 
     @mock.patch.object(
-        ffx_impl.FfxImpl,
-        "run",
-        side_effect=ffx_errors.FfxCommandError("error"),
-        autospec=True,
+        fuchsia_device_impl.FuchsiaDeviceImpl,
+        "health_check",
     )
-    def test_is_starnix_device_error(self, mock_ffx: mock.Mock) -> None:
-        """Testcase for FuchsiaDevice.is_starnix_device()"""
-        with self.assertRaises(errors.FuchsiaDeviceError):
-            self.fd_fc_obj.is_starnix_device()
+    @mock.patch.object(
+        fuchsia_controller_impl.FuchsiaControllerImpl,
+        "create_context",
+    )
+    @mock.patch.object(
+        sl4f_impl.Sl4fImpl,
+        "start_server",
+    )
+    def test_on_device_boot(
+        self,
+        mock_sl4f_start_server: mock.Mock,
+        mock_fc_create_context: mock.Mock,
+        mock_sl4f_health_check: mock.Mock,
+    ) -> None:
+        """Testcase for FuchsiaDevice.on_device_boot() when transport is set to
+        Fuchsia-Controller-Preferred"""
+        self.fd_sl4f_obj.on_device_boot()
 
-        mock_ffx.assert_called_once()
+        mock_sl4f_start_server.assert_called_once_with()
+        mock_fc_create_context.assert_called_once_with()
+        mock_sl4f_health_check.assert_called_once_with()
 
 
 if __name__ == "__main__":
@@ -6,12 +6,12 @@
 import ipaddress
 import json
 import unittest
-from collections.abc import Callable
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 from unittest import mock
 
 import fuchsia_controller_py as fuchsia_controller
-from parameterized import param, parameterized
 
 from honeydew import errors
 from honeydew.transports.ffx import config as ffx_config
@@ -42,6 +42,15 @@ _SUBTOOLS_SEARCH_PATH: str = "/subtools"
 _PROXY_TIMEOUT_SECS: int = 30
 _SSH_KEEPALIVE_TIMEOUT: int = 60
 
+# Arguments FfxImpl prepends to every ffx command it runs on the target.
+_FFX_CMD_PREFIX: tuple[str, ...] = (
+    _BINARY_PATH,
+    "-t",
+    str(_TARGET_SSH_ADDRESS),
+    "--isolate-dir",
+    _ISOLATE_DIR,
+)
+
 _FFX_TARGET_SHOW_JSON: dict[str, Any] = {
     "target": {
         "name": _TARGET_NAME,
@@ -99,7 +108,7 @@ _FFX_TARGET_LIST_OUTPUT: str = (
     '"addresses":["fe80::6a47:a931:1e84:5077%qemu"],"is_default":true}]\n'
 )
 
-_FFX_TARGET_LIST_JSON: list[dict[str, Any]] = [
+_FFX_TARGET_LIST_JSON: tuple[dict[str, Any], ...] = (
     {
         "nodename": _TARGET_NAME,
         "rcs_state": "Y",
@@ -108,76 +117,60 @@ _FFX_TARGET_LIST_JSON: list[dict[str, Any]] = [
         "target_state": "Product",
         "addresses": ["fe80::6a47:a931:1e84:5077%qemu"],
         "is_default": True,
-    }
-]
-
-
-_INPUT_ARGS: dict[str, Any] = {
-    "target_name": _TARGET_NAME,
-    "target_ip_port": _TARGET_SSH_ADDRESS,
-    "ffx_config_data": ffx_config.FfxConfigData(
-        isolate_dir=fuchsia_controller.IsolateDir(_ISOLATE_DIR),
-        logs_dir=_LOGS_DIR,
-        binary_path=_BINARY_PATH,
-        logs_level=_LOGS_LEVEL,
-        mdns_enabled=_MDNS_ENABLED,
-        subtools_search_path=_SUBTOOLS_SEARCH_PATH,
-        proxy_timeout_secs=_PROXY_TIMEOUT_SECS,
-        ssh_keepalive_timeout=_SSH_KEEPALIVE_TIMEOUT,
-    ),
-    "run_cmd": ffx_impl._FFX_CMDS["TARGET_SHOW"],
-}
-
-_MOCK_ARGS: dict[str, Any] = {
-    "ffx_target_show_output": _FFX_TARGET_SHOW_OUTPUT,
-    "ffx_target_show_json": _FFX_TARGET_SHOW_JSON,
-    "ffx_target_show_object": _FFX_TARGET_SHOW_INFO,
-    "ffx_target_ssh_address_output": f"[{_SSH_ADDRESS}]:{_SSH_PORT}",
-    "ffx_target_list_output": _FFX_TARGET_LIST_OUTPUT,
-    "ffx_target_list_json": _FFX_TARGET_LIST_JSON,
-}
-
-_EXPECTED_VALUES: dict[str, Any] = {
-    "ffx_target_show_output": _FFX_TARGET_SHOW_OUTPUT,
-    "ffx_target_show_object": _FFX_TARGET_SHOW_INFO,
-    "ffx_target_show_json": _FFX_TARGET_SHOW_JSON,
-    "ffx_target_list_json": _FFX_TARGET_LIST_JSON,
-}
+    },
+)
 
 
-def _custom_test_name_func(
-    testcase_func: Callable[..., None], _: str, param_arg: param
-) -> str:
-    """Custom name function method."""
-    test_func_name: str = testcase_func.__name__
+_INPUT_ARGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "target_name": _TARGET_NAME,
+        "target_ip_port": _TARGET_SSH_ADDRESS,
+        "ffx_config_data": ffx_config.FfxConfigData(
+            isolate_dir=fuchsia_controller.IsolateDir(_ISOLATE_DIR),
+            logs_dir=_LOGS_DIR,
+            binary_path=_BINARY_PATH,
+            logs_level=_LOGS_LEVEL,
+            mdns_enabled=_MDNS_ENABLED,
+            subtools_search_path=_SUBTOOLS_SEARCH_PATH,
+            proxy_timeout_secs=_PROXY_TIMEOUT_SECS,
+            ssh_keepalive_timeout=_SSH_KEEPALIVE_TIMEOUT,
+        ),
+        "run_cmd": ffx_impl._FFX_CMDS["TARGET_SHOW"],
+    }
+)
 
-    params_dict: dict[str, Any] = param_arg.args[0]
-    test_label: str = parameterized.to_safe_name(params_dict["label"])
+_MOCK_ARGS: Mapping[str, Any] = MappingProxyType(
+    {
+        "ffx_target_show_output": _FFX_TARGET_SHOW_OUTPUT,
+        "ffx_target_show_json": _FFX_TARGET_SHOW_JSON,
+        "ffx_target_show_object": _FFX_TARGET_SHOW_INFO,
+        "ffx_target_ssh_address_output": f"[{_SSH_ADDRESS}]:{_SSH_PORT}",
+        "ffx_target_list_output": _FFX_TARGET_LIST_OUTPUT,
+        "ffx_target_list_json": _FFX_TARGET_LIST_JSON,
+    }
+)
 
-    return f"{test_func_name}_with_{test_label}"
+_EXPECTED_VALUES: Mapping[str, Any] = MappingProxyType(
+    {
+        "ffx_target_show_output": _FFX_TARGET_SHOW_OUTPUT,
+        "ffx_target_show_object": _FFX_TARGET_SHOW_INFO,
+        "ffx_target_show_json": _FFX_TARGET_SHOW_JSON,
+        "ffx_target_list_json": _FFX_TARGET_LIST_JSON,
+    }
+)
 
 
 class FfxImplTests(unittest.TestCase):
     """Unit tests for ffx_impl.FfxImpl"""
 
-    def setUp(self) -> None:
-        super().setUp()
+    ffx_obj_with_ip: ffx_impl.FfxImpl
 
-        with (
-            mock.patch.object(
-                ffx_impl.FfxImpl,
-                "check_connection",
-                autospec=True,
-            ) as mock_ffx_check_connection,
-        ):
-            self.ffx_obj_wo_ip = ffx_impl.FfxImpl(
-                target_name=_INPUT_ARGS["target_name"],
-                config_data=_INPUT_ARGS["ffx_config_data"],
-            )
-        mock_ffx_check_connection.assert_called()
-
-        mock_ffx_check_connection.reset_mock()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
+        # FfxImpl holds no state besides its constructor arguments, so the
+        # object is built once and shared by every test in this class.
         with (
             mock.patch.object(
                 ffx_impl.FfxImpl,
@@ -190,13 +183,39 @@ class FfxImplTests(unittest.TestCase):
                 autospec=True,
             ) as mock_ffx_add_target,
         ):
-            self.ffx_obj_with_ip = ffx_impl.FfxImpl(
+            cls.ffx_obj_with_ip = ffx_impl.FfxImpl(
                 target_name=_INPUT_ARGS["target_name"],
                 target_ip_port=_INPUT_ARGS["target_ip_port"],
                 config_data=_INPUT_ARGS["ffx_config_data"],
             )
-        mock_ffx_check_connection.assert_called()
-        mock_ffx_add_target.assert_called()
+            mock_ffx_check_connection.assert_called_once_with(
+                cls.ffx_obj_with_ip
+            )
+            mock_ffx_add_target.assert_called_once_with(cls.ffx_obj_with_ip)
+
+    @mock.patch.object(
+        ffx_impl.FfxImpl,
+        "add_target",
+        autospec=True,
+    )
+    @mock.patch.object(
+        ffx_impl.FfxImpl,
+        "check_connection",
+        autospec=True,
+    )
+    def test_ffx_init_without_ip(
+        self,
+        mock_ffx_check_connection: mock.Mock,
+        mock_ffx_add_target: mock.Mock,
+    ) -> None:
+        """Test case for ffx_impl.FfxImpl() when called without target_ip_port."""
+        ffx_obj = ffx_impl.FfxImpl(
+            target_name=_INPUT_ARGS["target_name"],
+            config_data=_INPUT_ARGS["ffx_config_data"],
+        )
+
+        mock_ffx_check_connection.assert_called_once_with(ffx_obj)
+        mock_ffx_add_target.assert_not_called()
 
     def test_ffx_init_with_ip_as_target_name(self) -> None:
         """Test case for ffx_impl.FfxImpl() when called with target_name=<ip>."""
@@ -206,6 +225,13 @@ class FfxImplTests(unittest.TestCase):
                 config_data=_INPUT_ARGS["ffx_config_data"],
             )
 
+    def test_config(self) -> None:
+        """Test case for ffx_impl.FfxImpl.config property."""
+        # `FfxConfigData` is frozen, so it is shared rather than copied.
+        self.assertIs(
+            self.ffx_obj_with_ip.config, _INPUT_ARGS["ffx_config_data"]
+        )
+
     @mock.patch.object(
         ffx_impl.FfxImpl, "wait_for_rcs_connection", autospec=True
     )
@@ -259,8 +285,6 @@ class FfxImplTests(unittest.TestCase):
         self, mock_ffx_run: mock.Mock
     ) -> None:
         """Test case for get_target_info_from_target_list()."""
-        mock_ffx_run.return_value = _MOCK_ARGS["ffx_target_list_output"]
-
         self.assertEqual(
             self.ffx_obj_with_ip.get_target_info_from_target_list(),
             _EXPECTED_VALUES["ffx_target_list_json"][0],
@@ -346,69 +370,45 @@ class FfxImplTests(unittest.TestCase):
         )
 
         mock_host_shell_run.assert_called_with(
-            [
-                _BINARY_PATH,
-                "-t",
-                str(_TARGET_SSH_ADDRESS),
-                "--isolate-dir",
-                _ISOLATE_DIR,
-            ]
-            + ffx_impl._FFX_CMDS["TARGET_SHOW"],
+            list(_FFX_CMD_PREFIX) + ffx_impl._FFX_CMDS["TARGET_SHOW"],
             capture_output=True,
             log_output=True,
             timeout=None,
         )
 
-    @parameterized.expand(
-        [
-            (
-                {
-                    "label": "DeviceNotConnectedError",
-                    "side_effect": errors.HostCmdError(
-                        ffx_impl._DEVICE_NOT_CONNECTED,
-                    ),
-                    "expected_error": errors.DeviceNotConnectedError,
-                },
-            ),
-            (
-                {
-                    "label": "FfxCommandError",
-                    "side_effect": errors.HostCmdError(
-                        "command output and error",
-                    ),
-                    "expected_error": ffx_errors.FfxCommandError,
-                },
-            ),
-            (
-                {
-                    "label": "TimeoutExpired",
-                    "side_effect": errors.HoneydewTimeoutError(
-                        "timed out",
-                    ),
-                    "expected_error": ffx_errors.FfxTimeoutError,
-                },
-            ),
-        ],
-        name_func=_custom_test_name_func,
-    )
     @mock.patch.object(
         host_shell,
         "run",
         autospec=True,
     )
-    def test_ffx_run_exceptions(
-        self,
-        parameterized_dict: dict[str, Any],
-        mock_host_shell_run: mock.Mock,
-    ) -> None:
+    def test_ffx_run_exceptions(self, mock_host_shell_run: mock.Mock) -> None:
         """Test case for ffx_impl.run() raising different
         exceptions."""
-        mock_host_shell_run.side_effect = parameterized_dict["side_effect"]
+        for label, side_effect, expected_error in (
+            (
+                "DeviceNotConnectedError",
+                errors.HostCmdError(ffx_impl._DEVICE_NOT_CONNECTED),
+                errors.DeviceNotConnectedError,
+            ),
+            (
+                "FfxCommandError",
+                errors.HostCmdError("command output and error"),
+                ffx_errors.FfxCommandError,
+            ),
+            (
+                "TimeoutExpired",
+                errors.HoneydewTimeoutError("timed out"),
+                ffx_errors.FfxTimeoutError,
+            ),
+        ):
+            with self.subTest(label=label):
+                mock_host_shell_run.reset_mock()
+                mock_host_shell_run.side_effect = side_effect
 
-        with self.assertRaises(parameterized_dict["expected_error"]):
-            self.ffx_obj_with_ip.run(cmd=_INPUT_ARGS["run_cmd"])
+                with self.assertRaises(expected_error):
+                    self.ffx_obj_with_ip.run(cmd=_INPUT_ARGS["run_cmd"])
 
-        mock_host_shell_run.assert_called()
+                mock_host_shell_run.assert_called()
 
     @mock.patch.object(
         ffx_impl.FfxImpl,
@@ -477,14 +477,7 @@ class FfxImplTests(unittest.TestCase):
         )
 
         mock_host_shell_popen.assert_called_with(
-            [
-                _BINARY_PATH,
-                "-t",
-                str(_TARGET_SSH_ADDRESS),
-                "--isolate-dir",
-                _ISOLATE_DIR,
-            ]
-            + ["a", "b", "c"],
+            list(_FFX_CMD_PREFIX) + ["a", "b", "c"],
             stdout="abc",
         )
 
@@ -495,48 +488,33 @@ class FfxImplTests(unittest.TestCase):
 
         mock_host_shell_run.assert_called_once()
 
-    @parameterized.expand(
-        [
-            (
-                {
-                    "label": "DeviceNotConnectedError",
-                    "side_effect": errors.HostCmdError(
-                        ffx_impl._DEVICE_NOT_CONNECTED,
-                    ),
-                    "expected_error": errors.DeviceNotConnectedError,
-                },
-            ),
-            (
-                {
-                    "label": "FfxCommandError",
-                    "side_effect": errors.HostCmdError(
-                        "command output and error",
-                    ),
-                    "expected_error": ffx_errors.FfxCommandError,
-                },
-            ),
-        ],
-        name_func=_custom_test_name_func,
-    )
     @mock.patch.object(
         host_shell,
         "run",
         autospec=True,
     )
-    def test_add_target_exception(
-        self,
-        parameterized_dict: dict[str, Any],
-        mock_host_shell_run: mock.Mock,
-    ) -> None:
+    def test_add_target_exception(self, mock_host_shell_run: mock.Mock) -> None:
         """Verify ffx_cli.add_target raise exception in failure cases."""
-        mock_host_shell_run.side_effect = parameterized_dict["side_effect"]
-
-        expected = parameterized_dict["expected_error"]
+        for label, side_effect, expected_error in (
+            (
+                "DeviceNotConnectedError",
+                errors.HostCmdError(ffx_impl._DEVICE_NOT_CONNECTED),
+                errors.DeviceNotConnectedError,
+            ),
+            (
+                "FfxCommandError",
+                errors.HostCmdError("command output and error"),
+                ffx_errors.FfxCommandError,
+            ),
+        ):
+            with self.subTest(label=label):
+                mock_host_shell_run.reset_mock()
+                mock_host_shell_run.side_effect = side_effect
 
-        with self.assertRaises(expected):
-            self.ffx_obj_with_ip.add_target()
+                with self.assertRaises(expected_error):
+                    self.ffx_obj_with_ip.add_target()
 
-        mock_host_shell_run.assert_called_once()
+                mock_host_shell_run.assert_called_once()
 
     @mock.patch.object(
         ffx_impl.FfxImpl,
@@ -556,10 +534,24 @@ class FfxImplTests(unittest.TestCase):
     def test_wait_for_rcs_connection(self, mock_ffx_run: mock.Mock) -> None:
         """Test case for ffx_impl.wait_for_rcs_connection()"""
         self.ffx_obj_with_ip.wait_for_rcs_connection()
-        mock_ffx_run.assert_called()
+        mock_ffx_run.assert_called_once_with(
+            self.ffx_obj_with_ip, cmd=ffx_impl._FFX_CMDS["TARGET_WAIT"]
+        )
 
     @mock.patch.object(ffx_impl.FfxImpl, "run", return_value="", autospec=True)
     def test_wait_for_rcs_disconnection(self, mock_ffx_run: mock.Mock) -> None:
         """Test case for ffx_impl.wait_for_rcs_disconnection()"""
         self.ffx_obj_with_ip.wait_for_rcs_disconnection()
-        self.assertEqual(mock_ffx_run.call_count, 2)
+        self.assertEqual(
+            mock_ffx_run.call_args_list,
+            [
+                mock.call(
+                    self.ffx_obj_with_ip,
+                    cmd=ffx_impl._FFX_CMDS["TARGET_WAIT_DOWN"],
+                ),
+                mock.call(
+                    self.ffx_obj_with_ip,
+                    cmd=ffx_impl._FFX_CMDS["TARGET_DISCONNECT"],
+                ),
+            ],
+        )
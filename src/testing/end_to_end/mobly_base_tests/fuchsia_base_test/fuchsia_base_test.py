@@ -66,6 +66,17 @@ class TracingOn(enum.StrEnum):
     NEVER = "never"
 
 
+# Tracing modes that trace a whole test class.
+_TRACING_ON_TEARDOWN_CLASS: frozenset[TracingOn] = frozenset(
+    {TracingOn.TEARDOWN_CLASS, TracingOn.TEARDOWN_CLASS_ON_FAIL}
+)
+
+# Tracing modes that trace each test case.
+_TRACING_ON_TEARDOWN_TEST: frozenset[TracingOn] = frozenset(
+    {TracingOn.TEARDOWN_TEST, TracingOn.TEARDOWN_TEST_ON_FAIL}
+)
+
+
 class FuchsiaBaseTest(base_test.BaseTestClass):
     """Fuchsia base test class.
 
@@ -102,10 +113,13 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
             fuchsia_device.FuchsiaDevice
         ] = self.register_controller(fuchsia_device_mobly_controller)
 
-        if (
-            self.tracing_on == TracingOn.TEARDOWN_CLASS
-            or self.tracing_on == TracingOn.TEARDOWN_CLASS_ON_FAIL
-        ):
+        # Power switch and outlet of each device, keyed by device name. Filled in
+        # the first time a device needs to be recovered.
+        self._power_switches: dict[
+            str, tuple[power_switch.PowerSwitch, int | None]
+        ] = {}
+
+        if self.tracing_on in _TRACING_ON_TEARDOWN_CLASS:
             for device in self.fuchsia_devices:
                 device.tracing.initialize(categories=self.trace_categories)
                 device.tracing.start()
@@ -120,23 +134,20 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
         """
         self._devices_not_healthy: bool = False
 
-        self.test_case_path: str = (
-            f"{self.log_path}/{self.current_test_info.name}"
-        )
-        os.mkdir(self.test_case_path)
+        test_name: str = self.current_test_info.name
+        self.test_case_path: str = f"{self.log_path}/{test_name}"
+        # exist_ok so that a retried test case can reuse its directory.
+        os.makedirs(self.test_case_path, exist_ok=True)
         self._log_message_to_devices(
-            message=f"Started executing '{self.current_test_info.name}' "
+            message=f"Started executing '{test_name}' "
             f"Lacewing test case...",
             level=custom_types.LEVEL.INFO,
         )
-        for device in self.fuchsia_devices:
-            if (
-                not device.tracing.is_active()
-                and not device.tracing.is_session_initialized()
-            ):
+        if self.tracing_on in _TRACING_ON_TEARDOWN_TEST:
+            for device in self.fuchsia_devices:
                 if (
-                    self.tracing_on == TracingOn.TEARDOWN_TEST
-                    or self.tracing_on == TracingOn.TEARDOWN_TEST_ON_FAIL
+                    not device.tracing.is_active()
+                    and not device.tracing.is_session_initialized()
                 ):
                     device.tracing.initialize(categories=self.trace_categories)
                     device.tracing.start()
@@ -148,32 +159,31 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
             * Takes snapshot of all the fuchsia devices and stores it under
               test case directory if `snapshot_on` test param is set to
               "teardown_test"
+            * Stops, terminates and downloads the trace data for all devices
+              into the test case directory if `tracing_on` test param is set
+              to "teardown_test".
             * Logs a info message onto device that test case has ended.
         """
+        test_name: str = self.current_test_info.name
         self._health_check_and_recover()
 
         if self.snapshot_on == SnapshotOn.TEARDOWN_TEST:
             self._collect_snapshot(directory=self.test_case_path)
 
         _LOGGER.info("Closing any active tracing sessions.")
-        for device in self.fuchsia_devices:
-            if (
-                device.tracing.is_active()
-                and device.tracing.is_session_initialized()
-            ):
-                if self.tracing_on == TracingOn.TEARDOWN_TEST:
-                    device.tracing.stop()
-                    device.tracing.terminate_and_download(
-                        directory=self.test_case_path
-                    )
+        if self.tracing_on == TracingOn.TEARDOWN_TEST:
+            self._stop_tracing_and_download(directory=self.test_case_path)
 
         _LOGGER.info("Completed closing active tracing sessions.")
         self._log_message_to_devices(
-            message=f"Finished executing '{self.current_test_info.name}' "
+            message=f"Finished executing '{test_name}' "
             f"Lacewing test case...",
             level=custom_types.LEVEL.INFO,
         )
-        if len(os.listdir(self.test_case_path)) == 0:
+        # Stop at the first entry instead of listing the whole directory.
+        with os.scandir(self.test_case_path) as entries:
+            test_case_path_empty: bool = next(entries, None) is None
+        if test_case_path_empty:
             os.rmdir(self.test_case_path)
 
         if self._devices_not_healthy:
@@ -199,24 +209,13 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
         """
         self._teardown_class_artifacts: str = f"{self.log_path}/teardown_class"
 
-        for device in self.fuchsia_devices:
-            if (
-                device.tracing.is_active()
-                and device.tracing.is_session_initialized()
-            ):
-                if self.tracing_on == TracingOn.TEARDOWN_CLASS:
-                    device.tracing.stop()
-                    device.tracing.terminate_and_download(
-                        directory=self._teardown_class_artifacts
-                    )
-                elif (
-                    self.tracing_on == TracingOn.TEARDOWN_CLASS_ON_FAIL
-                    and self._any_test_failed
-                ):
-                    device.tracing.stop()
-                    device.tracing.terminate_and_download(
-                        directory=self._teardown_class_artifacts
-                    )
+        if self.tracing_on == TracingOn.TEARDOWN_CLASS or (
+            self.tracing_on == TracingOn.TEARDOWN_CLASS_ON_FAIL
+            and self._any_test_failed
+        ):
+            self._stop_tracing_and_download(
+                directory=self._teardown_class_artifacts
+            )
 
         if self.snapshot_on == SnapshotOn.TEARDOWN_CLASS:
             self._teardown_class_artifacts = f"{self.log_path}/teardown_class"
@@ -242,17 +241,8 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
         if self.snapshot_on == SnapshotOn.TEARDOWN_TEST_ON_FAIL:
             self._collect_snapshot(directory=self.test_case_path)
 
-        for device in self.fuchsia_devices:
-            if (
-                device.tracing.is_active()
-                and device.tracing.is_session_initialized()
-            ):
-                if self.tracing_on == TracingOn.TEARDOWN_TEST_ON_FAIL:
-                    for device in self.fuchsia_devices:
-                        device.tracing.stop()
-                        device.tracing.terminate_and_download(
-                            directory=self.test_case_path
-                        )
+        if self.tracing_on == TracingOn.TEARDOWN_TEST_ON_FAIL:
+            self._stop_tracing_and_download(directory=self.test_case_path)
 
     def _collect_snapshot(self, directory: str) -> None:
         """Collects snapshots for all the FuchsiaDevice objects and stores them
@@ -269,6 +259,8 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
             "Collecting snapshots of all the FuchsiaDevice objects in '%s'...",
             self.snapshot_on.value,
         )
+        # One device at a time, on the calling thread: the FIDL bindings behind
+        # snapshot, logging and tracing are not thread-safe.
         for fx_device in self.fuchsia_devices:
             try:
                 fx_device.snapshot(directory=directory)
@@ -316,13 +308,7 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
             ]
             ```
         """
-        for (
-            controller_name,
-            controller_configs,
-        ) in self.controller_configs.items():
-            if controller_name == controller_type:
-                return controller_configs
-        return []
+        return self.controller_configs.get(controller_type, [])
 
     def _get_device_config(
         self, controller_type: str, identifier_key: str, identifier_value: str
@@ -415,7 +401,11 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
             fx_device: FuchsiaDevice object
         """
         try:
-            switch, outlet = self._lookup_power_switch(fx_device)
+            if fx_device.device_name not in self._power_switches:
+                self._power_switches[fx_device.device_name] = (
+                    self._lookup_power_switch(fx_device)
+                )
+            switch, outlet = self._power_switches[fx_device.device_name]
             fx_device.power_cycle(power_switch=switch, outlet=outlet)
         except power_switch_using_dmc.PowerSwitchDmcError as err:
             _LOGGER.warning(
@@ -565,6 +555,23 @@ class FuchsiaBaseTest(base_test.BaseTestClass):
                     err,
                 )
 
+    def _stop_tracing_and_download(self, directory: str) -> None:
+        """Stop the active tracing sessions on all the Fuchsia devices and
+        download the trace data.
+
+        Args:
+            directory: Absolute path on the host where trace files need to be
+                saved.
+        """
+
+        for fx_device in self.fuchsia_devices:
+            if (
+                fx_device.tracing.is_active()
+                and fx_device.tracing.is_session_initialized()
+            ):
+                fx_device.tracing.stop()
+                fx_device.tracing.terminate_and_download(directory=directory)
+
     def _process_metric_user_params(self) -> None:
         """Reads, processes and stores the metric collection params used by this module.
 
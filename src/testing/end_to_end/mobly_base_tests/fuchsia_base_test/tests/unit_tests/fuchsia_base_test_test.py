@@ -0,0 +1,172 @@
+# Copyright 2026 The Fuchsia Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+"""Unit tests for fuchsia_base_test.py."""
+
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fuchsia_base_test import fuchsia_base_test
+from honeydew import errors
+from honeydew.fuchsia_device import fuchsia_device
+from honeydew.typing import custom_types
+from mobly import config_parser
+
+_DEVICE_NAMES: tuple[str, ...] = ("fuchsia-emulator-1", "fuchsia-emulator-2")
+
+
+def _mock_device(device_name: str) -> mock.MagicMock:
+    """Returns a mocked FuchsiaDevice object with the given name."""
+    device = mock.MagicMock(spec=fuchsia_device.FuchsiaDevice)
+    device.device_name = device_name
+    return device
+
+
+class FuchsiaBaseTestTests(unittest.TestCase):
+    """Unit tests for fuchsia_base_test.FuchsiaBaseTest"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(log_dir.cleanup)
+
+        config = config_parser.TestRunConfig()
+        config.log_path = log_dir.name
+        config.testbed_name = "testbed"
+        config.summary_writer = mock.Mock()
+        self.test_obj = fuchsia_base_test.FuchsiaBaseTest(config)
+
+        self.devices: list[mock.MagicMock] = [
+            _mock_device(device_name) for device_name in _DEVICE_NAMES
+        ]
+
+    def _setup_class(self, devices: list[mock.MagicMock]) -> None:
+        """Runs setup_class with `devices` as the registered FuchsiaDevices."""
+        with mock.patch.object(
+            fuchsia_base_test.FuchsiaBaseTest,
+            "register_controller",
+            autospec=True,
+            return_value=devices,
+        ):
+            self.test_obj.setup_class()
+
+    def test_collect_snapshot(self) -> None:
+        """Test case for FuchsiaBaseTest._collect_snapshot()"""
+        self._setup_class(self.devices)
+        self.devices[0].snapshot.side_effect = RuntimeError("error")
+
+        self.test_obj._collect_snapshot(directory="/tmp/snapshots")
+
+        for device in self.devices:
+            device.snapshot.assert_called_once_with(directory="/tmp/snapshots")
+
+    def test_log_message_to_devices(self) -> None:
+        """Test case for FuchsiaBaseTest._log_message_to_devices()"""
+        self._setup_class(self.devices)
+        self.devices[0].log_message_to_device.side_effect = RuntimeError(
+            "error"
+        )
+
+        self.test_obj._log_message_to_devices(
+            message="message", level=custom_types.LEVEL.INFO
+        )
+
+        for device in self.devices:
+            device.log_message_to_device.assert_called_once_with(
+                "message", custom_types.LEVEL.INFO
+            )
+
+    def test_stop_tracing_and_download(self) -> None:
+        """Test case for FuchsiaBaseTest._stop_tracing_and_download() only
+        stopping the active tracing sessions"""
+        self._setup_class(self.devices)
+        self.devices[0].tracing.is_active.return_value = False
+        self.devices[1].tracing.is_active.return_value = True
+        self.devices[1].tracing.is_session_initialized.return_value = True
+
+        self.test_obj._stop_tracing_and_download(directory="/tmp/traces")
+
+        self.devices[0].tracing.stop.assert_not_called()
+        self.devices[0].tracing.terminate_and_download.assert_not_called()
+        self.devices[1].tracing.stop.assert_called_once_with()
+        self.devices[1].tracing.terminate_and_download.assert_called_once_with(
+            directory="/tmp/traces"
+        )
+
+    def test_device_operations_do_not_overlap(self) -> None:
+        """Test case for the per-device operations of FuchsiaBaseTest running
+        one at a time on the main thread, as the FIDL bindings behind them are
+        not thread-safe"""
+        self._setup_class(self.devices)
+        lock = threading.Lock()
+        active: list[int] = [0]
+        max_active: list[int] = [0]
+        threads: list[threading.Thread] = []
+
+        def _device_call(*_: object, **__: object) -> None:
+            with lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+                threads.append(threading.current_thread())
+            # Leave room for a concurrent call on another device to start.
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        for device in self.devices:
+            device.snapshot.side_effect = _device_call
+            device.log_message_to_device.side_effect = _device_call
+            device.tracing.is_active.return_value = True
+            device.tracing.is_session_initialized.return_value = True
+            device.tracing.stop.side_effect = _device_call
+            device.tracing.terminate_and_download.side_effect = _device_call
+
+        self.test_obj._collect_snapshot(directory="/tmp/snapshots")
+        self.test_obj._log_message_to_devices(
+            message="message", level=custom_types.LEVEL.INFO
+        )
+        self.test_obj._stop_tracing_and_download(directory="/tmp/traces")
+
+        self.assertEqual(max_active[0], 1)
+        self.assertEqual(
+            threads, [threading.main_thread()] * (4 * len(self.devices))
+        )
+
+    def test_health_check_and_recover_on_main_thread(self) -> None:
+        """Test case for FuchsiaBaseTest._health_check_and_recover() running the
+        health checks on the main thread"""
+        self._setup_class(self.devices)
+        threads: list[threading.Thread] = []
+        for device in self.devices:
+            device.health_check.side_effect = lambda: threads.append(
+                threading.current_thread()
+            )
+
+        self.test_obj._health_check_and_recover()
+
+        self.assertEqual(threads, [threading.main_thread()] * len(self.devices))
+
+    def test_health_check_and_recover_with_unhealthy_device(self) -> None:
+        """Test case for FuchsiaBaseTest._health_check_and_recover() when one of
+        the devices fails the health check"""
+        self._setup_class(self.devices)
+        self.test_obj._devices_not_healthy = False
+        self.devices[1].health_check.side_effect = errors.HealthCheckError(
+            "error"
+        )
+
+        with mock.patch.object(
+            self.test_obj, "_recover_device", autospec=True
+        ) as mock_recover_device:
+            self.test_obj._health_check_and_recover()
+
+        mock_recover_device.assert_called_once_with(self.devices[1])
+        self.assertTrue(self.test_obj._devices_not_healthy)
+
+
+if __name__ == "__main__":
+    unittest.main()
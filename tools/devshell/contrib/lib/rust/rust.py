@@ -8,7 +8,7 @@ import hashlib
 import os
 import platform
 import re
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 ROOT_PATH = Path(os.environ.get("FUCHSIA_DIR", ""))
@@ -24,15 +24,57 @@ HOST_PLATFORM = (
     ]
 )
 
+# A regular expression for parsing build target labels.
+# [\w-] is a valid GN name. We also accept '/' and '.' in paths.
+# For the toolchain suffix, we take the whole label name at once, so we allow ':'.
+_BUILD_LABEL_REGEX = re.compile(
+    r"([\w/.-]*)" + r"(:([+\w.-]+))?" + r"(\(([\w./:+-]+)\))?$"
+)
+# Here are some examples of matching labels
+assert (
+    _BUILD_LABEL_REGEX.match(
+        "//third_party/rust_crates:zstd-v0_11_2+zstd_1_5_2.rustdoc(//build/toolchain/fuchsia:x64)",
+    )
+    is not None
+)
+assert _BUILD_LABEL_REGEX.match("//src/lib/fuchsia-async") is not None
+assert _BUILD_LABEL_REGEX.match("//build/rust/tests:clippy_test") is not None
+
+# Characters besides \w that may appear in a label's path or name.
+_PATH_PUNCTUATION = str.maketrans("", "", "/.-_")
+_NAME_PUNCTUATION = str.maketrans("", "", "+.-_")
+
+
+def _fast_parse(label):
+    """Splits a label without a toolchain suffix into (path, name, None).
+
+    Returns None when the label is not of that simple shape, in which case
+    callers should fall back to _BUILD_LABEL_REGEX.
+    """
+    if "(" in label:
+        return None
+    path, sep, name = label.partition(":")
+    stripped_path = path.translate(_PATH_PUNCTUATION)
+    if stripped_path and not stripped_path.isalnum():
+        return None
+    if not sep:
+        return path, None, None
+    stripped_name = name.translate(_NAME_PUNCTUATION)
+    if not name or (stripped_name and not stripped_name.isalnum()):
+        return None
+    return path, name, None
+
 
 class GnTarget:
     def __init__(self, gn_target, fuchsia_dir=None):
-        build_label_regex = get_build_label_regex()
-        match = re.match(build_label_regex, gn_target)
-        if match is None:
-            print(f"Invalid GN label '{gn_target}'")
-            raise ValueError(gn_target)
-        path, name, toolchain = match.group(1, 3, 5)
+        parsed = _fast_parse(gn_target)
+        if parsed is None:
+            match = _BUILD_LABEL_REGEX.match(gn_target)
+            if match is None:
+                print(f"Invalid GN label '{gn_target}'")
+                raise ValueError(gn_target)
+            parsed = match.group(1, 3, 5)
+        path, name, toolchain = parsed
 
         if fuchsia_dir is None:
             fuchsia_dir = ROOT_PATH
@@ -52,13 +94,14 @@ class GnTarget:
     def __str__(self):
         return self.gn_target
 
-    @property
+    @cached_property
     def ninja_target(self):
         """The canonical GN label of this target, minus the leading '//'."""
         return (
             str(self.label_path) + ":" + self.label_name + self.toolchain_suffix
         )
 
+    @cached_property
     def __actual_ninja_target(self):
         """The canonical GN label of the ".actual" target, minus the leading '//'."""
         label_name = self.label_name
@@ -66,12 +109,20 @@ class GnTarget:
             label_name += ".actual"
         return str(self.label_path) + ":" + label_name + self.toolchain_suffix
 
-    @property
+    @cached_property
+    def __hashed_actual_ninja_target(self):
+        """The SHA-1 hex digest of the ".actual" target's label, used to name
+        its cargo directory."""
+        return hashlib.sha1(
+            self.__actual_ninja_target.encode("utf-8")
+        ).hexdigest()
+
+    @cached_property
     def gn_target(self):
         """The canonical GN label of this target, including the leading '//'."""
         return "//" + self.ninja_target
 
-    @property
+    @cached_property
     def toolchain_suffix(self):
         """The GN path suffix for this target's toolchain, if it is not the default."""
         if (
@@ -81,7 +132,7 @@ class GnTarget:
             return ""
         return "({})".format(self.explicit_toolchain)
 
-    @property
+    @cached_property
     def src_path(self):
         """The path to the directory containing this target's BUILD.gn file."""
         return ROOT_PATH / self.label_path
@@ -102,37 +153,25 @@ class GnTarget:
         """The path to Cargo.toml for this target."""
         if build_dir is None:
             build_dir = FUCHSIA_BUILD_DIR
+        elif not isinstance(build_dir, Path):
+            build_dir = Path(build_dir)
 
-        hashed_gn_path = hashlib.sha1(
-            self.__actual_ninja_target().encode("utf-8")
-        ).hexdigest()
-        return Path(build_dir) / "cargo" / hashed_gn_path / "Cargo.toml"
+        return (
+            build_dir
+            / "cargo"
+            / self.__hashed_actual_ninja_target
+            / "Cargo.toml"
+        )
 
 
-@lru_cache
 def get_build_label_regex():
     """get a regular expression for parsing build target labels"""
-    # [\w-] is a valid GN name. We also accept '/' and '.' in paths.
-    # For the toolchain suffix, we take the whole label name at once, so we allow ':'.
-    build_label_regex = (
-        r"([\w/.-]*)" + r"(:([+\w.-]+))?" + r"(\(([\w./:+-]+)\))?$"
-    )
-    # Here are some examples of matching labels
-    assert (
-        re.match(
-            build_label_regex,
-            "//third_party/rust_crates:zstd-v0_11_2+zstd_1_5_2.rustdoc(//build/toolchain/fuchsia:x64)",
-        )
-        is not None
-    )
-    assert re.match(build_label_regex, "//src/lib/fuchsia-async") is not None
-    assert (
-        re.match(build_label_regex, "//build/rust/tests:clippy_test")
-        is not None
-    )
-    return re.compile(build_label_regex)
+    return _BUILD_LABEL_REGEX
 
 
 @lru_cache
 def default_toolchain(build_dir):
-    return open(build_dir / "default_toolchain_name.txt").read()
+    with open(build_dir / "default_toolchain_name.txt") as f:
+        # Strip any trailing newline so the label compares equal to a
+        # target's explicit toolchain.
+        return f.read().strip()
@@ -9,9 +9,10 @@ import os
 import re
 import subprocess
 import sys
-from typing import Any, Dict, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Sequence, TextIO
 
-_CPP_EXTENSIONS = [".cc", ".c", ".cpp"]
+_CPP_EXTENSIONS = (".cc", ".c", ".cpp")
 _OPT_PATTERN = re.compile("[\W]+")
 
 _SHOULD_LOG = False
@@ -20,6 +21,17 @@ _FUCHSIA_PACKAGE_SUFFIX = "_fuchsia_package"
 
 _FUCHSIA_CPU_MAP = {"aarch64": "arm64", "x86_64": "x64"}
 
+# Maps the GN `optimize` arg to the bazel compilation mode. Anything else uses
+# fastbuild.
+_COMPILATION_MODES = {
+    "debug": "--compilation_mode=dbg",
+    "size": "--compilation_mode=opt",
+    "speed": "--compilation_mode=opt",
+    "profile": "--compilation_mode=opt",
+    "size_lto": "--compilation_mode=opt",
+    "size_thinlto": "--compilation_mode=opt",
+}
+
 _BAZEL_CPU_ALIASES = {
     "k8": "x86_64",
     "x64": "x86_64",
@@ -83,6 +95,17 @@ _REGEX_PATH_PATTERNS = [
     ),
 ]
 
+# All of _REGEX_PATH_PATTERNS as one alternation, so that an argument is
+# matched against them in a single pass. The named groups are made
+# non-capturing since they repeat between patterns; group i + 1 is the whole
+# of pattern i, and the pattern that matched is rerun to get its named groups.
+_COMBINED_PATH_PATTERN = re.compile(
+    "|".join(
+        "({})".format(re.sub(r"\(\?P<\w+>", "(?:", pattern.pattern))
+        for pattern, _ in _REGEX_PATH_PATTERNS
+    )
+)
+
 
 class Action:
     """Represents an action that comes from aquery"""
@@ -94,9 +117,10 @@ class Action:
         self.arguments = action["arguments"]
         self.environment_vars = action["environmentVariables"]
         self.file = extract_file_from_args(self.arguments)
+        self._is_external = not self.label.startswith(("//", "@//"))
 
     def is_external(self) -> bool:
-        return not (self.label.startswith("//") or self.label.startswith("@//"))
+        return self._is_external
 
 
 class CompDBFormatter:
@@ -115,12 +139,20 @@ class CompDBFormatter:
         self.output_base_rel = os.path.relpath(output_base, build_dir)
         self.output_path = output_path
         self.output_path_rel = os.path.relpath(output_path, build_dir)
+        # Prefixes used to rewrite paths, built once rather than per argument.
+        self._output_base_prefix = self.output_base_rel + "/"
+        self._output_path_prefix = self.output_path_rel + "/"
+        self._external_prefix = (
+            os.path.join(self.output_base_rel, "external") + "/"
+        )
+        # Cache of maybe_rewrite_path results, keyed by argument.
+        self._rewritten_paths: Dict[str, str] = {}
 
     def rewrite_file(self, action) -> str:
         if action.is_external():
-            return os.path.join(self.output_base_rel, action.file)
+            return self._output_base_prefix + action.file
         else:
-            return os.path.join("../..", action.file)
+            return "../../" + action.file
 
     def maybe_rewrite_path(self, file_path, action) -> str:
         # Check to see if this is the file we are building. Need to take special
@@ -128,6 +160,15 @@ class CompDBFormatter:
         if file_path == action.file:
             return self.rewrite_file(action)
 
+        # Every other rewrite only depends on the argument itself, and the same
+        # include paths and flags show up in most actions.
+        rewritten = self._rewritten_paths.get(file_path)
+        if rewritten is None:
+            rewritten = self._rewrite_path(file_path)
+            self._rewritten_paths[file_path] = rewritten
+        return rewritten
+
+    def _rewrite_path(self, file_path) -> str:
         # Bazel adds -iquote "." -iquote for files that are being compiled from
         # the internal repository. This changes those to point back to the root
         # of the fuchisa source tree.
@@ -158,25 +199,24 @@ class CompDBFormatter:
         # path. The _virtual_includes tend to not point to files that exist when
         # working in our hybrid build system so we end up just pointing to the
         # GN paths instead.
-        for pattern, replacement in _REGEX_PATH_PATTERNS:
-            match_obj = pattern.match(file_path)
-            if match_obj:
-                return replacement(match_obj)
+        # All of the patterns need a _virtual_includes path, so skip the regex
+        # for the (much more common) arguments that do not have one.
+        if "_virtual_includes" in file_path:
+            combined_match = _COMBINED_PATH_PATTERN.match(file_path)
+            if combined_match:
+                pattern, replacement = _REGEX_PATH_PATTERNS[
+                    combined_match.lastindex - 1
+                ]
+                return replacement(pattern.match(file_path))
 
         # map bazel-out/ paths to that of our output_path
         if "bazel-out/" in file_path:
-            return file_path.replace(
-                "bazel-out/", self.output_path_rel + "/", 1
-            )
+            return file_path.replace("bazel-out/", self._output_path_prefix, 1)
 
         # Look for arguments to files in external/ paths. This is usually
         # the clang binary and include roots
         if "external/" in file_path:
-            return file_path.replace(
-                "external/",
-                os.path.join(self.output_base_rel, "external") + "/",
-                1,
-            )
+            return file_path.replace("external/", self._external_prefix, 1)
 
         # Just a regular argument
         return file_path
@@ -212,15 +252,7 @@ def extract_file_from_args(args: Sequence[str]) -> str:
     actions are type erased when they are returned in the query so we can't
     just grab the file that is being compiled from the arguments.
     """
-
-    def get_ext(f):
-        p = f.rfind(".")
-        if p > 0:
-            return f[p:]
-        else:
-            return ""
-
-    files = [arg for arg in args if get_ext(arg) in _CPP_EXTENSIONS]
+    files = [arg for arg in args if arg.endswith(_CPP_EXTENSIONS)]
     assert len(files) == 1, "Should only be compiling a single file"
     return files[0]
 
@@ -260,12 +292,7 @@ def get_action_graph_from_labels(
 def compilation_mode(args: Sequence[str]) -> str:
     # sometimes the optimization is escape quoted so we clean it up.
     opt = _OPT_PATTERN.sub("", args.optimization)
-    if opt == "debug":
-        return "--compilation_mode=dbg"
-    elif opt in ["size", "speed", "profile", "size_lto", "size_thinlto"]:
-        return "--compilation_mode=opt"
-    else:
-        return "--compilation_mode=fastbuild"
+    return _COMPILATION_MODES.get(opt, "--compilation_mode=fastbuild")
 
 
 def canonicalize_label_from_arg(label: str) -> str:
@@ -325,6 +352,21 @@ def collect_labels_from_scope(bazel_exe: str, scope: str) -> Sequence[str]:
         )
 
 
+def write_compile_commands(f: TextIO, compile_commands: Iterable[Dict]):
+    """Writes the compile commands to f as an indented JSON list.
+
+    The output is the same as json.dump(list(compile_commands), f, indent=2),
+    but each entry is encoded in one go and written with a single call rather
+    than written a few characters at a time by json.dump.
+    """
+    separator = "[\n  "
+    for compile_command in compile_commands:
+        f.write(separator)
+        f.write(json.dumps(compile_command, indent=2).replace("\n", "\n  "))
+        separator = ",\n  "
+    f.write("[]" if separator == "[\n  " else "\n]")
+
+
 def fail(msg: str, exit_code=1):
     print("ERROR: ", msg)
     sys.exit(exit_code)
@@ -341,10 +383,6 @@ def init_logger(args):
         _SHOULD_LOG = True
 
 
-def is_none(obj: Any) -> bool:
-    return obj == None
-
-
 def main(argv: Sequence[str]):
     parser = argparse.ArgumentParser(description="Refresh bazel compdb")
 
@@ -398,7 +436,7 @@ def main(argv: Sequence[str]):
     args = parser.parse_args(argv)
     init_logger(args)
 
-    if is_none(args.label) and is_none(args.dir):
+    if args.label is None and args.dir is None:
         fail("Either --label or --dir must be set.")
 
     labels = []
@@ -434,60 +472,61 @@ def main(argv: Sequence[str]):
         output_path,
     )
 
-    new_compile_commands = []
-    for action in actions:
-        new_compile_commands.append(
-            formatter.action_to_compile_commands(action)
-        )
-
-    compile_commands_dict = {}
     compile_commands_path = os.path.join(
         args.build_dir, "compile_commands.json"
     )
     with open(
         compile_commands_path,
-        "r",
+        "r+",
     ) as f:
-        compile_commands = json.load(f)
-        compile_commands.extend(new_compile_commands)
-        for compile_command in compile_commands:
+        compile_commands_dict = {
+            compile_command["file"]: compile_command
+            for compile_command in json.load(f)
+        }
+
+        # The bazel commands replace any existing command for the same file.
+        for action in actions:
+            compile_command = formatter.action_to_compile_commands(action)
             compile_commands_dict[compile_command["file"]] = compile_command
 
-    with open(
-        compile_commands_path,
-        "w",
-    ) as f:
-        json.dump(list(compile_commands_dict.values()), f, indent=2)
+        f.seek(0)
+        write_compile_commands(f, compile_commands_dict.values())
+        f.truncate()
 
     if args.self_test_filter:
+        self_test_filter = re.compile(args.self_test_filter)
         commands_to_check = [
             c
-            for c in compile_commands
-            if re.search(args.self_test_filter, c["file"])
+            for c in compile_commands_dict.values()
+            if self_test_filter.search(c["file"])
         ]
         info("CHECKING {} commands".format(len(commands_to_check)))
         info(
             "SKIPPING {} commands".format(
-                len(compile_commands) - len(commands_to_check)
+                len(compile_commands_dict) - len(commands_to_check)
             )
         )
-        num_failures = 0
 
-        for command in commands_to_check:
+        def check_command(command: Dict) -> bool:
             if "arguments" in command:
                 clang_args = command["arguments"]
             else:
                 clang_args = command["command"].split()
 
-            try:
-                subprocess.check_output(
-                    clang_args,
-                    text=True,
-                    cwd=command["directory"],
-                    stderr=None if args.verbose else subprocess.DEVNULL,
-                )
-            except subprocess.CalledProcessError:
-                num_failures += 1
+            result = subprocess.run(
+                clang_args,
+                cwd=command["directory"],
+                stdout=subprocess.DEVNULL,
+                stderr=None if args.verbose else subprocess.DEVNULL,
+            )
+            return result.returncode == 0
+
+        # Each check is a separate clang process, so run them side by side.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            num_failures = sum(
+                not passed
+                for passed in executor.map(check_command, commands_to_check)
+            )
 
         if num_failures > 0:
             info(f"SELF TEST RESULTS: {num_failures} FAILURES")